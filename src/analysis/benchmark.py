@@ -1,28 +1,69 @@
 import os
 import sys
-from typing import List, Dict
+from typing import Any, List, Dict, Tuple, Optional
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
 
 import time
 import pandas as pd
+import pyarrow as pa
 from loguru import logger
 from sqlalchemy import text
-from services.mysql_handler import MySQLClient
+from services.mysql_handler import MySQLClient, PHYSICAL_PROFILES, partition_date_range
 from services.mongo_handler import MongoDBClient
+from services.duckdb_handler import DuckDBClient
 from analysis.comparison_queries import (
     mysql_total_pedidos_por_cliente_query,
-    mongodb_total_pedidos_por_cliente_pipeline,
     mysql_total_vendido_por_produto_query,
-    mongodb_total_vendido_por_produto_pipeline,
     mysql_avg_gasto_por_cliente_query,
-    mongodb_avg_gasto_por_cliente_pipeline
+    MONGODB_MODEL_PIPELINES,
+    SCATTER_GATHER_QUERIES,
+    TIME_WINDOW_QUERIES,
+    MONGODB_TIME_BUCKETS,
+    MONGODB_DATE_INDEXES
 )
+from analysis.reference_queries import REFERENCE_QUERIES, window_start
+from analysis.verification import compare_with_reference
+from services.sharding import (
+    ShardedDuckDBClient,
+    ShardedMongoDBClient,
+    ShardedMySQLClient,
+    get_shard_uris,
+    load_sharded_mongo,
+    scatter_gather
+)
+from etl.mongo_models import MODEL_COLLECTIONS, MONGO_MODELS, dataset_documents
 
 BENCHMARK_PATH = "data/csv/benchmarks"
 BENCHMARK_FILE = os.path.join(BENCHMARK_PATH, "benchmark_results.csv")
+MONGO_MODELS_FILE = os.path.join(BENCHMARK_PATH, "mongo_models_results.csv")
+MYSQL_PROFILES_FILE = os.path.join(BENCHMARK_PATH, "mysql_profiles_results.csv")
+SHARDING_FILE = os.path.join(BENCHMARK_PATH, "sharding_results.csv")
+TIME_WINDOW_FILE = os.path.join(BENCHMARK_PATH, "time_window_results.csv")
+# Shards DuckDB em processo medidos no benchmark de sharding (sem instâncias externas)
+IN_PROCESS_SHARDS = 4
+RELATIONAL_TABLES = ("clientes", "produtos", "pedidos", "itens_pedido", "avaliacoes")
+
+# Parâmetros da execução adicionados a cada linha de resultado (ver set_run_params)
+RUN_PARAMS: Dict[str, Any] = {}
+
+MYSQL_QUERIES = {
+    "total_pedidos_por_cliente": mysql_total_pedidos_por_cliente_query,
+    "total_vendido_por_produto": mysql_total_vendido_por_produto_query,
+    "avg_gasto_por_cliente": mysql_avg_gasto_por_cliente_query,
+}
 os.makedirs(BENCHMARK_PATH, exist_ok=True)
 
+def mysql_queries(tables: Dict[str, pd.DataFrame]) -> Dict[str, str]:
+    """
+    Retorna as consultas MySQL comparativas e as de janela de tempo (com o início da
+    janela calculado a partir das tabelas), por label.
+    """
+    queries = {label: query_fn() for label, query_fn in MYSQL_QUERIES.items()}
+    for label, (query_fn, *_) in TIME_WINDOW_QUERIES.items():
+        queries[label] = query_fn(window_start(tables, label))
+    return queries
+
 def benchmark_mysql_query(client: MySQLClient, query: str, label: str) -> float:
     start = time.perf_counter()
     with client.engine.connect() as conn:
@@ -41,13 +82,39 @@ def benchmark_mongodb_query(client: MongoDBClient, pipeline: List[Dict], collect
     logger.success(f"MongoDB '{label}' executada em {duration:.4f} segundos.")
     return duration
 
-def run_benchmark():
+def benchmark_duckdb_query(client: DuckDBClient, query: str, label: str) -> float:
+    start = time.perf_counter()
+    df = client.query(query)
+    duration = time.perf_counter() - start
+    df.to_csv(f"{BENCHMARK_PATH}/duckdb_{label}.csv", index=False)
+    logger.success(f"DuckDB '{label}' executada em {duration:.4f} segundos.")
+    return duration
+
+def benchmark_mongodb_model_query(client: MongoDBClient, model: str, label: str) -> float:
+    collection, pipeline_fn = MONGODB_MODEL_PIPELINES[model][label]
+    return benchmark_mongodb_query(client, pipeline_fn(), collection, label)
+
+def run_benchmark(tables: Optional[Dict[str, pd.DataFrame]] = None, mongo_model: str = "referenced"):
+    """
+    Executa as consultas comparativas no MySQL, no MongoDB e no DuckDB embarcado.
+
+    Args:
+        tables (Optional[Dict[str, pd.DataFrame]]): Tabelas transformadas usadas pelo DuckDB.
+            Se None, as tabelas são lidas do MySQL.
+        mongo_model (str): Modelo de documentos carregado no banco 'ecommerce' (ver etl/mongo_models.py).
+            As consultas de janela de tempo no MongoDB são ignoradas se o modelo não tiver a coleção usada.
+    """
     logger.info("🔍 Iniciando benchmarks de performance...")
 
     mysql = MySQLClient()
     mongodb = MongoDBClient()
     mongodb.connect("ecommerce")
 
+    if tables is None:
+        tables = {name: mysql.read_table(name) for name in RELATIONAL_TABLES}
+    duckdb_client = DuckDBClient()
+    duckdb_client.register_tables(tables)
+
     resultados = []
 
     # Benchmark 1: Total pedidos por cliente
@@ -59,7 +126,12 @@ def run_benchmark():
     resultados.append({
         "query": "total_pedidos_por_cliente",
         "banco": "MongoDB",
-        "tempo": benchmark_mongodb_query(mongodb, mongodb_total_pedidos_por_cliente_pipeline(), "carts", "total_pedidos_por_cliente")
+        "tempo": benchmark_mongodb_model_query(mongodb, mongo_model, "total_pedidos_por_cliente")
+    })
+    resultados.append({
+        "query": "total_pedidos_por_cliente",
+        "banco": "DuckDB",
+        "tempo": benchmark_duckdb_query(duckdb_client, mysql_total_pedidos_por_cliente_query(), "total_pedidos_por_cliente")
     })
 
     # Benchmark 2: Total vendido por produto
@@ -71,7 +143,12 @@ def run_benchmark():
     resultados.append({
         "query": "total_vendido_por_produto",
         "banco": "MongoDB",
-        "tempo": benchmark_mongodb_query(mongodb, mongodb_total_vendido_por_produto_pipeline(), "carts", "total_vendido_por_produto")
+        "tempo": benchmark_mongodb_model_query(mongodb, mongo_model, "total_vendido_por_produto")
+    })
+    resultados.append({
+        "query": "total_vendido_por_produto",
+        "banco": "DuckDB",
+        "tempo": benchmark_duckdb_query(duckdb_client, mysql_total_vendido_por_produto_query(), "total_vendido_por_produto")
     })
 
     # Benchmark 3: Média de gasto por cliente
@@ -83,19 +160,328 @@ def run_benchmark():
     resultados.append({
         "query": "avg_gasto_por_cliente",
         "banco": "MongoDB",
-        "tempo": benchmark_mongodb_query(mongodb, mongodb_avg_gasto_por_cliente_pipeline(), "carts", "avg_gasto_por_cliente")
+        "tempo": benchmark_mongodb_model_query(mongodb, mongo_model, "avg_gasto_por_cliente")
     })
+    resultados.append({
+        "query": "avg_gasto_por_cliente",
+        "banco": "DuckDB",
+        "tempo": benchmark_duckdb_query(duckdb_client, mysql_avg_gasto_por_cliente_query(), "avg_gasto_por_cliente")
+    })
+
+    # Benchmarks 4 a 6: janelas de tempo (receita diária, pedidos por mês, média móvel de avaliação em 30 dias)
+    for label, (query_fn, collection, pipeline_fn, _, _) in TIME_WINDOW_QUERIES.items():
+        inicio = window_start(tables, label)
+        resultados.append({
+            "query": label,
+            "banco": "MySQL",
+            "tempo": benchmark_mysql_query(mysql, query_fn(inicio), label)
+        })
+        if collection in MODEL_COLLECTIONS[mongo_model]:
+            resultados.append({
+                "query": label,
+                "banco": "MongoDB",
+                "tempo": benchmark_mongodb_query(mongodb, pipeline_fn(inicio), collection, label)
+            })
+        else:
+            logger.warning(f"MongoDB '{label}' ignorada: coleção '{collection}' ausente no modelo '{mongo_model}'.")
+        resultados.append({
+            "query": label,
+            "banco": "DuckDB",
+            "tempo": benchmark_duckdb_query(duckdb_client, query_fn(inicio), label)
+        })
+
+    duckdb_client.close()
 
     # Append ou cria o CSV sem apagar o existente
-    df_new = pd.DataFrame(resultados)
-    if os.path.exists(BENCHMARK_FILE):
-        df_existing = pd.read_csv(BENCHMARK_FILE)
-        df_concat = pd.concat([df_existing, df_new], ignore_index=True)
-        df_concat.to_csv(BENCHMARK_FILE, index=False)
-    else:
-        df_new.to_csv(BENCHMARK_FILE, index=False)
+    append_results(resultados, BENCHMARK_FILE)
 
     logger.success("✅ Benchmarks concluídos e salvos com sucesso.")
 
+def set_run_params(**params: Any) -> None:
+    """
+    Define os parâmetros da execução (run_id, semente, tamanhos, distribuição, data de
+    referência...) gravados como colunas em todas as linhas de resultado por append_results.
+    """
+    RUN_PARAMS.clear()
+    RUN_PARAMS.update(params)
+
+def append_results(resultados: List[Dict], path: str) -> pd.DataFrame:
+    """
+    Adiciona linhas de resultado a um CSV, criando o arquivo se não existir.
+    Cada linha recebe os parâmetros da execução definidos em set_run_params.
+
+    Returns:
+        pd.DataFrame: Conteúdo completo do arquivo após a inclusão das linhas.
+    """
+    df_new = pd.DataFrame(resultados).assign(**RUN_PARAMS)
+    if os.path.exists(path):
+        df_existing = pd.read_csv(path)
+        df_new = pd.concat([df_existing, df_new], ignore_index=True)
+    df_new.to_csv(path, index=False)
+    return df_new
+
+def run_mongo_models_benchmark(dataset: Dict[str, pa.Table], models: Tuple[str, ...] = MONGO_MODELS) -> None:
+    """
+    Carrega o dataset em cada modelo de documentos do MongoDB (um banco por modelo)
+    e mede tempo de carga, tamanho dos dados, tamanho em disco e latência das consultas.
+
+    Args:
+        dataset (Dict[str, pa.Table]): Registros gerados (clients, products, reviews, carts).
+        models (Tuple[str, ...]): Modelos de documentos a comparar.
+    """
+    logger.info("🔍 Iniciando benchmark dos modelos de documentos do MongoDB...")
+    resultados = []
+
+    for model in models:
+        mongodb = MongoDBClient()
+        mongodb.connect(f"ecommerce_{model}")
+        documents = dataset_documents(model, dataset)
+        mongodb.drop_collections(list(documents))
+
+        start = time.perf_counter()
+        for collection, docs in documents.items():
+            mongodb.insert_many(collection, docs)
+        tempo_carga = time.perf_counter() - start
+
+        stats = [mongodb.collection_stats(collection) for collection in documents]
+        tamanho_dados = sum(s["size"] for s in stats) / 1024 ** 2
+        tamanho_storage = sum(s["storageSize"] + s["totalIndexSize"] for s in stats) / 1024 ** 2
+        logger.info(
+            f"Modelo '{model}': carga em {tempo_carga:.4f}s, "
+            f"{tamanho_dados:.2f} MB de dados, {tamanho_storage:.2f} MB em disco."
+        )
+
+        for label, (collection, pipeline_fn) in MONGODB_MODEL_PIPELINES[model].items():
+            resultados.append({
+                "modelo": model,
+                "query": label,
+                "tempo": benchmark_mongodb_query(mongodb, pipeline_fn(), collection, f"{model}_{label}"),
+                "tempo_carga": tempo_carga,
+                "tamanho_dados_mb": tamanho_dados,
+                "tamanho_storage_mb": tamanho_storage,
+            })
+        mongodb.client.close()
+
+    append_results(resultados, MONGO_MODELS_FILE)
+    logger.success("✅ Benchmark dos modelos de documentos concluído e salvo com sucesso.")
+
+def load_mysql_tables(client: MySQLClient, tables: Dict[str, pd.DataFrame], profile: str = "baseline") -> float:
+    """
+    Recria o schema com o perfil físico informado e carrega as tabelas, retornando o tempo de carga.
+    As partições do perfil 'partitioned' cobrem o intervalo de datas das próprias tabelas.
+    """
+    client.drop_all_tables()
+    client.create_all_tables(profile, partition_date_range(tables))
+    start = time.perf_counter()
+    for table_name, df in tables.items():
+        client.df_to_table(df, table_name)
+    return time.perf_counter() - start
+
+def run_mysql_profiles_benchmark(
+    tables: Dict[str, pd.DataFrame], profiles: Tuple[str, ...] = PHYSICAL_PROFILES
+) -> None:
+    """
+    Executa as consultas comparativas em cada perfil de desenho físico do MySQL e mede
+    latência, tamanho de dados/índices e a penalidade no tempo de carga em relação ao baseline.
+    Ao final o schema é restaurado no perfil 'baseline'. O marcador de carga da pipeline é
+    removido junto com as tabelas; cabe a quem chama regravá-lo com a chave das tabelas carregadas.
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Tabelas transformadas, na ordem de carga.
+        profiles (Tuple[str, ...]): Perfis físicos a comparar.
+    """
+    logger.info("🔍 Iniciando benchmark dos perfis físicos do MySQL...")
+    mysql = MySQLClient()
+    queries = mysql_queries(tables)
+    resultados = []
+    tempo_carga_baseline = None
+
+    for profile in profiles:
+        tempo_carga = load_mysql_tables(mysql, tables, profile)
+        if profile == "baseline":
+            tempo_carga_baseline = tempo_carga
+
+        sizes = mysql.table_sizes()
+        dados_mb = sizes["dados_bytes"].sum() / 1024 ** 2
+        indices_mb = sizes["indices_bytes"].sum() / 1024 ** 2
+        logger.info(
+            f"Perfil '{profile}': carga em {tempo_carga:.4f}s, "
+            f"{dados_mb:.2f} MB de dados, {indices_mb:.2f} MB de índices."
+        )
+
+        for label, query in queries.items():
+            resultados.append({
+                "perfil": profile,
+                "query": label,
+                "tempo": benchmark_mysql_query(mysql, query, f"{profile}_{label}"),
+                "tempo_carga": tempo_carga,
+                "penalidade_carga": (
+                    tempo_carga - tempo_carga_baseline if tempo_carga_baseline is not None else None
+                ),
+                "dados_mb": dados_mb,
+                "indices_mb": indices_mb,
+            })
+
+    if profiles[-1] != "baseline":
+        load_mysql_tables(mysql, tables, "baseline")
+
+    append_results(resultados, MYSQL_PROFILES_FILE)
+    logger.success("✅ Benchmark dos perfis físicos concluído e salvo com sucesso.")
+
+def run_time_window_benchmark(dataset: Dict[str, pa.Table], tables: Dict[str, pd.DataFrame]) -> None:
+    """
+    Compara as consultas de janela de tempo no MongoDB (banco ecommerce_time_window) em três
+    variantes: coleções brutas sem índice ('sem_indice'), com índice na data ('indice_data')
+    e pré-agregadas em buckets diários via $merge ('buckets'). O custo de preparo (criação
+    dos índices ou dos buckets) é registrado em 'tempo_preparo'. No MySQL os índices de data
+    e o particionamento são comparados em run_mysql_profiles_benchmark.
+
+    Args:
+        dataset (Dict[str, pa.Table]): Registros gerados (clients, products, reviews, carts).
+        tables (Dict[str, pd.DataFrame]): Tabelas transformadas, usadas para calcular as janelas.
+    """
+    logger.info("🔍 Iniciando benchmark das consultas de janela de tempo no MongoDB...")
+    mongodb = MongoDBClient()
+    mongodb.connect("ecommerce_time_window")
+    documents = dataset_documents("referenced", dataset)
+    mongodb.drop_collections(list(documents) + list(MONGODB_TIME_BUCKETS))
+    for collection, docs in documents.items():
+        mongodb.insert_many(collection, docs)
+
+    def prepare_indexes() -> None:
+        for collection, field in MONGODB_DATE_INDEXES.items():
+            mongodb.db[collection].create_index(field)
+
+    def prepare_buckets() -> None:
+        for bucket, (source, pipeline_fn, indexes) in MONGODB_TIME_BUCKETS.items():
+            list(mongodb.db[source].aggregate(pipeline_fn()))
+            for keys in indexes:
+                mongodb.db[bucket].create_index(keys)
+
+    resultados = []
+    for variante, prepare in (("sem_indice", None), ("indice_data", prepare_indexes), ("buckets", prepare_buckets)):
+        start = time.perf_counter()
+        if prepare is not None:
+            prepare()
+        tempo_preparo = time.perf_counter() - start
+
+        for label, (_, collection, pipeline_fn, bucket, bucket_pipeline_fn) in TIME_WINDOW_QUERIES.items():
+            inicio = window_start(tables, label)
+            if variante == "buckets":
+                collection, pipeline = bucket, bucket_pipeline_fn(inicio)
+            else:
+                pipeline = pipeline_fn(inicio)
+            resultados.append({
+                "banco": "MongoDB",
+                "variante": variante,
+                "query": label,
+                "inicio_janela": inicio,
+                "tempo": benchmark_mongodb_query(mongodb, pipeline, collection, f"{variante}_{label}"),
+                "tempo_preparo": tempo_preparo,
+            })
+
+    mongodb.client.close()
+    append_results(resultados, TIME_WINDOW_FILE)
+    logger.success("✅ Benchmark das janelas de tempo concluído e salvo com sucesso.")
+
+def benchmark_scatter_gather(fetch, rule: Dict, banco: str, label: str) -> Tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    df = scatter_gather(fetch, rule)
+    duration = time.perf_counter() - start
+    df.to_csv(f"{BENCHMARK_PATH}/{banco.lower()}_{label}.csv", index=False)
+    logger.success(f"{banco} '{label}' (scatter-gather) executada em {duration:.4f} segundos.")
+    return duration, df
+
+def run_sharding_benchmark(
+    dataset: Dict[str, pa.Table],
+    tables: Dict[str, pd.DataFrame],
+    mongo_uris: Optional[List[str]] = None,
+    mysql_uris: Optional[List[str]] = None,
+    in_process_shards: int = IN_PROCESS_SHARDS,
+) -> None:
+    """
+    Mede a escalabilidade de 1 a N shards: para cada quantidade de shards, carrega os
+    dados roteados por hash de cliente_id e executa as consultas em scatter-gather.
+    As URIs vêm de MONGO_SHARD_URIS / MYSQL_SHARD_URIS quando não informadas;
+    backends sem URIs configuradas são ignorados. Os shards DuckDB em processo
+    (banco 'DuckDB') rodam sempre, sem depender de instâncias externas.
+
+    Cada resultado combinado é comparado com o resultado de nó único (referência em
+    memória sobre as tabelas completas) na coluna 'igual_single_node'.
+
+    Args:
+        dataset (Dict[str, pa.Table]): Registros gerados para o MongoDB.
+        tables (Dict[str, pd.DataFrame]): Tabelas transformadas para o MySQL e o DuckDB.
+        mongo_uris (Optional[List[str]]): URIs dos shards MongoDB.
+        mysql_uris (Optional[List[str]]): URIs dos shards MySQL.
+        in_process_shards (int): Quantidade máxima de shards DuckDB em processo.
+    """
+    mongo_uris = mongo_uris if mongo_uris is not None else get_shard_uris("MONGO_SHARD_URIS")
+    mysql_uris = mysql_uris if mysql_uris is not None else get_shard_uris("MYSQL_SHARD_URIS")
+    if not mongo_uris and not mysql_uris:
+        logger.warning(
+            "Nenhum shard configurado (MONGO_SHARD_URIS/MYSQL_SHARD_URIS); "
+            "apenas os shards DuckDB em processo serão medidos."
+        )
+
+    logger.info("🔍 Iniciando benchmark de sharding...")
+    references = {label: REFERENCE_QUERIES[label][0](tables) for label in SCATTER_GATHER_QUERIES}
+    resultados = []
+
+    def sharded_result(banco: str, num_shards: int, label: str, fetch, rule: Dict, tempo_carga: float) -> Dict:
+        tempo, df = benchmark_scatter_gather(fetch, rule, banco, f"sharded{num_shards}_{label}")
+        _, key, metric = REFERENCE_QUERIES[label]
+        motivo = compare_with_reference(df, references[label], key, metric)
+        if motivo:
+            logger.error(f"❌ {banco} com {num_shards} shard(s) diverge do nó único em '{label}': {motivo}.")
+        return {
+            "banco": banco,
+            "shards": num_shards,
+            "query": label,
+            "tempo": tempo,
+            "tempo_carga": tempo_carga,
+            "igual_single_node": motivo is None,
+        }
+
+    for num_shards in range(1, len(mongo_uris) + 1):
+        mongodb = ShardedMongoDBClient(mongo_uris[:num_shards])
+        start = time.perf_counter()
+        load_sharded_mongo(mongodb, dataset)
+        tempo_carga = time.perf_counter() - start
+        for label, (_, collection, pipeline_fn, rule) in SCATTER_GATHER_QUERIES.items():
+            resultados.append(sharded_result(
+                "MongoDB", num_shards, label, lambda: mongodb.aggregate(collection, pipeline_fn()), rule, tempo_carga
+            ))
+        mongodb.close()
+
+    for num_shards in range(1, len(mysql_uris) + 1):
+        mysql = ShardedMySQLClient(mysql_uris[:num_shards])
+        mysql.recreate_tables(date_range=partition_date_range(tables))
+        start = time.perf_counter()
+        mysql.load_tables(tables)
+        tempo_carga = time.perf_counter() - start
+        for label, (query_fn, _, _, rule) in SCATTER_GATHER_QUERIES.items():
+            resultados.append(sharded_result(
+                "MySQL", num_shards, label, lambda: mysql.read_sql(query_fn()), rule, tempo_carga
+            ))
+        mysql.close()
+
+    for num_shards in range(1, in_process_shards + 1):
+        duckdb_shards = ShardedDuckDBClient(num_shards)
+        start = time.perf_counter()
+        duckdb_shards.load_tables(tables)
+        tempo_carga = time.perf_counter() - start
+        for label, (query_fn, _, _, rule) in SCATTER_GATHER_QUERIES.items():
+            resultados.append(sharded_result(
+                "DuckDB", num_shards, label, lambda: duckdb_shards.read_sql(query_fn()), rule, tempo_carga
+            ))
+        duckdb_shards.close()
+
+    df = pd.DataFrame(resultados)
+    base = df[df["shards"] == 1].set_index(["banco", "query"])["tempo"]
+    df["speedup"] = base.reindex(pd.MultiIndex.from_frame(df[["banco", "query"]])).to_numpy() / df["tempo"]
+    append_results(df.to_dict("records"), SHARDING_FILE)
+    logger.success("✅ Benchmark de sharding concluído e salvo com sucesso.")
+
 if __name__ == "__main__":
     run_benchmark()
@@ -1,3 +1,4 @@
+from datetime import date, timedelta
 from typing import List, Dict
 
 def mysql_total_pedidos_por_cliente_query() -> str:
@@ -164,3 +165,557 @@ def mongodb_avg_gasto_por_cliente_pipeline() -> list:
         {"$sort": {"media_gasto": -1}},
         {"$limit": 10}
     ]
+
+def mongodb_total_pedidos_por_cliente_snapshot_pipeline() -> List[Dict]:
+    """
+    Pipeline para total de pedidos por cliente no modelo embedded_snapshot (sem $lookup), limitado ao top 10.
+    """
+    return [
+        {
+            "$group": {
+                "_id": "$cliente_id",
+                "nome": {"$first": "$cliente_nome"},
+                "total_pedidos": {"$sum": 1}
+            }
+        },
+        {
+            "$project": {
+                "cliente_id": "$_id",
+                "nome": 1,
+                "total_pedidos": 1,
+                "_id": 0
+            }
+        },
+        {"$sort": {"total_pedidos": -1}},
+        {"$limit": 10}
+    ]
+
+def mongodb_total_pedidos_por_cliente_client_embedded_pipeline() -> List[Dict]:
+    """
+    Pipeline para total de pedidos por cliente no modelo client_embedded (coleção clients), limitado ao top 10.
+    """
+    return [
+        {
+            "$project": {
+                "cliente_id": "$id",
+                "nome": 1,
+                "total_pedidos": {"$size": "$carts"},
+                "_id": 0
+            }
+        },
+        {"$sort": {"total_pedidos": -1}},
+        {"$limit": 10}
+    ]
+
+def mongodb_total_vendido_por_produto_client_embedded_pipeline() -> List[Dict]:
+    """
+    Pipeline para total vendido por produto no modelo client_embedded (coleção clients), limitado ao top 10.
+    """
+    return [
+        {"$unwind": "$carts"},
+        {"$unwind": "$carts.itens"},
+        {
+            "$group": {
+                "_id": "$carts.itens.produto_id",
+                "total_vendido": {"$sum": "$carts.itens.quantidade"}
+            }
+        },
+        {
+            "$lookup": {
+                "from": "products",
+                "localField": "_id",
+                "foreignField": "id",
+                "as": "produto_info"
+            }
+        },
+        {"$unwind": "$produto_info"},
+        {
+            "$project": {
+                "produto_id": "$_id",
+                "nome": "$produto_info.nome",
+                "total_vendido": 1,
+                "_id": 0
+            }
+        },
+        {"$sort": {"total_vendido": -1}},
+        {"$limit": 10}
+    ]
+
+def mongodb_avg_gasto_por_cliente_snapshot_pipeline() -> List[Dict]:
+    """
+    Pipeline para média de gastos por pedido por cliente no modelo embedded_snapshot (sem $lookup), limitado ao top 10.
+    """
+    return [
+        {
+            "$project": {
+                "cliente_id": 1,
+                "cliente_nome": 1,
+                "total_pedido": {
+                    "$sum": {
+                        "$map": {
+                            "input": "$itens",
+                            "as": "item",
+                            "in": {"$multiply": ["$$item.quantidade", "$$item.preco_unitario"]}
+                        }
+                    }
+                }
+            }
+        },
+        {
+            "$group": {
+                "_id": "$cliente_id",
+                "nome": {"$first": "$cliente_nome"},
+                "media_gasto": {"$avg": "$total_pedido"}
+            }
+        },
+        {
+            "$project": {
+                "cliente_id": "$_id",
+                "nome": 1,
+                "media_gasto": 1,
+                "_id": 0
+            }
+        },
+        {"$sort": {"media_gasto": -1}},
+        {"$limit": 10}
+    ]
+
+def mongodb_avg_gasto_por_cliente_client_embedded_pipeline() -> List[Dict]:
+    """
+    Pipeline para média de gastos por pedido por cliente no modelo client_embedded (coleção clients), limitado ao top 10.
+    """
+    return [
+        {"$match": {"carts.0": {"$exists": True}}},
+        {
+            "$project": {
+                "cliente_id": "$id",
+                "nome": 1,
+                "media_gasto": {
+                    "$avg": {
+                        "$map": {
+                            "input": "$carts",
+                            "as": "cart",
+                            "in": {
+                                "$sum": {
+                                    "$map": {
+                                        "input": "$$cart.itens",
+                                        "as": "item",
+                                        "in": {"$multiply": ["$$item.quantidade", "$$item.preco_unitario"]}
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "_id": 0
+            }
+        },
+        {"$sort": {"media_gasto": -1}},
+        {"$limit": 10}
+    ]
+
+# Pipelines por modelo de documentos (ver etl/mongo_models.py): label -> (coleção, função do pipeline)
+MONGODB_MODEL_PIPELINES = {
+    "referenced": {
+        "total_pedidos_por_cliente": ("carts", mongodb_total_pedidos_por_cliente_pipeline),
+        "total_vendido_por_produto": ("carts", mongodb_total_vendido_por_produto_pipeline),
+        "avg_gasto_por_cliente": ("carts", mongodb_avg_gasto_por_cliente_pipeline),
+    },
+    "embedded_snapshot": {
+        "total_pedidos_por_cliente": ("carts", mongodb_total_pedidos_por_cliente_snapshot_pipeline),
+        "total_vendido_por_produto": ("carts", mongodb_total_vendido_por_produto_pipeline),
+        "avg_gasto_por_cliente": ("carts", mongodb_avg_gasto_por_cliente_snapshot_pipeline),
+    },
+    "client_embedded": {
+        "total_pedidos_por_cliente": ("clients", mongodb_total_pedidos_por_cliente_client_embedded_pipeline),
+        "total_vendido_por_produto": ("clients", mongodb_total_vendido_por_produto_client_embedded_pipeline),
+        "avg_gasto_por_cliente": ("clients", mongodb_avg_gasto_por_cliente_client_embedded_pipeline),
+    },
+}
+
+# Consultas parciais para scatter-gather em shards (ver services/sharding.py).
+# Cada shard retorna agregados aditivos de todos os grupos (sem ORDER BY/LIMIT);
+# a ordenação, o top 10 e as médias são calculados após a combinação no cliente.
+
+def mysql_total_pedidos_por_cliente_partial_query() -> str:
+    """
+    Query parcial (por shard) do total de pedidos por cliente.
+    """
+    return """
+    SELECT
+        c.id AS cliente_id,
+        c.nome,
+        COUNT(p.id) AS total_pedidos
+    FROM clientes c
+    LEFT JOIN pedidos p ON p.cliente_id = c.id
+    GROUP BY c.id, c.nome;
+    """
+
+def mysql_total_vendido_por_produto_partial_query() -> str:
+    """
+    Query parcial (por shard) do total vendido por produto.
+    """
+    return """
+    SELECT
+        pr.id AS produto_id,
+        pr.nome,
+        COALESCE(SUM(ip.quantidade), 0) AS total_vendido
+    FROM produtos pr
+    LEFT JOIN itens_pedido ip ON ip.produto_id = pr.id
+    GROUP BY pr.id, pr.nome;
+    """
+
+def mysql_avg_gasto_por_cliente_partial_query() -> str:
+    """
+    Query parcial (por shard) com soma de gastos e contagem de pedidos por cliente.
+    """
+    return """
+    SELECT
+        c.id AS cliente_id,
+        c.nome,
+        COALESCE(SUM(ip.quantidade * ip.preco_unitario), 0) AS total_gasto,
+        COUNT(DISTINCT p.id) AS total_pedidos
+    FROM clientes c
+    LEFT JOIN pedidos p ON p.cliente_id = c.id
+    LEFT JOIN itens_pedido ip ON ip.pedido_id = p.id
+    GROUP BY c.id, c.nome;
+    """
+
+def mongodb_total_pedidos_por_cliente_partial_pipeline() -> List[Dict]:
+    """
+    Pipeline parcial (por shard) do total de pedidos por cliente.
+    """
+    return mongodb_total_pedidos_por_cliente_pipeline()[:-2]
+
+def mongodb_total_vendido_por_produto_partial_pipeline() -> List[Dict]:
+    """
+    Pipeline parcial (por shard) do total vendido por produto.
+    """
+    return mongodb_total_vendido_por_produto_pipeline()[:-2]
+
+def mongodb_avg_gasto_por_cliente_partial_pipeline() -> List[Dict]:
+    """
+    Pipeline parcial (por shard) com soma de gastos e contagem de pedidos por cliente.
+    """
+    return mongodb_avg_gasto_por_cliente_pipeline()[:-3] + [
+        {
+            "$project": {
+                "cliente_id": "$_id",
+                "nome": "$cliente_info.nome",
+                "total_gasto": 1,
+                "total_pedidos": 1,
+                "_id": 0
+            }
+        }
+    ]
+
+# label -> (consulta MySQL parcial, coleção MongoDB, pipeline MongoDB parcial, regra de combinação)
+SCATTER_GATHER_QUERIES = {
+    "total_pedidos_por_cliente": (
+        mysql_total_pedidos_por_cliente_partial_query,
+        "carts",
+        mongodb_total_pedidos_por_cliente_partial_pipeline,
+        {"keys": ["cliente_id", "nome"], "sums": ["total_pedidos"], "order_by": "total_pedidos"},
+    ),
+    "total_vendido_por_produto": (
+        mysql_total_vendido_por_produto_partial_query,
+        "carts",
+        mongodb_total_vendido_por_produto_partial_pipeline,
+        {"keys": ["produto_id", "nome"], "sums": ["total_vendido"], "order_by": "total_vendido"},
+    ),
+    "avg_gasto_por_cliente": (
+        mysql_avg_gasto_por_cliente_partial_query,
+        "carts",
+        mongodb_avg_gasto_por_cliente_partial_pipeline,
+        {
+            "keys": ["cliente_id", "nome"],
+            "sums": ["total_gasto", "total_pedidos"],
+            "order_by": "media_gasto",
+            "ratio": ("media_gasto", "total_gasto", "total_pedidos"),
+        },
+    ),
+}
+
+# Consultas de janela de tempo. A janela começa em `inicio` ('YYYY-MM-DD'), calculado a partir
+# da data mais recente dos dados (ver reference_queries.window_start), e é passada como
+# constante para permitir range scans nos índices de data e partition pruning no MySQL.
+# No MongoDB as datas são strings ISO-8601, comparadas lexicograficamente.
+# pedidos_por_mes e avaliacao_movel_30d_por_produto retornam séries completas (sem top 10).
+
+# Largura da média móvel de avaliacao_movel_30d_por_produto, em dias (incluindo o dia corrente)
+ROLLING_DAYS = 30
+
+def mysql_receita_diaria_query(inicio: str) -> str:
+    """
+    Retorna a query SQL dos 10 dias de maior receita na janela iniciada em `inicio`.
+    """
+    return f"""
+    SELECT
+        CAST(p.data_pedido AS DATE) AS dia,
+        SUM(ip.quantidade * ip.preco_unitario) AS receita
+    FROM pedidos p
+    JOIN itens_pedido ip ON ip.pedido_id = p.id
+    WHERE p.data_pedido >= '{inicio}'
+    GROUP BY dia
+    ORDER BY receita DESC
+    LIMIT 10;
+    """
+
+def mongodb_receita_diaria_pipeline(inicio: str) -> List[Dict]:
+    """
+    Pipeline MongoDB dos 10 dias de maior receita na janela iniciada em `inicio`.
+    """
+    return [
+        {"$match": {"ultima_atualizacao": {"$gte": inicio}}},
+        {"$unwind": "$itens"},
+        {
+            "$group": {
+                "_id": {"$substrCP": ["$ultima_atualizacao", 0, 10]},
+                "receita": {"$sum": {"$multiply": ["$itens.quantidade", "$itens.preco_unitario"]}}
+            }
+        },
+        {"$project": {"dia": "$_id", "receita": 1, "_id": 0}},
+        {"$sort": {"receita": -1}},
+        {"$limit": 10}
+    ]
+
+def mysql_pedidos_por_mes_query(inicio: str) -> str:
+    """
+    Retorna a query SQL da série mensal de pedidos (ordenada por mês) na janela iniciada em `inicio`.
+    """
+    return f"""
+    SELECT
+        YEAR(p.data_pedido) * 100 + MONTH(p.data_pedido) AS ano_mes,
+        COUNT(*) AS total_pedidos
+    FROM pedidos p
+    WHERE p.data_pedido >= '{inicio}'
+    GROUP BY ano_mes
+    ORDER BY ano_mes;
+    """
+
+def _mongodb_ano_mes(field: str) -> Dict:
+    # 'YYYY-MM-...' -> YYYYMM (inteiro), igual a YEAR(x) * 100 + MONTH(x) no SQL
+    return {"$toInt": {"$concat": [{"$substrCP": [field, 0, 4]}, {"$substrCP": [field, 5, 2]}]}}
+
+def mongodb_pedidos_por_mes_pipeline(inicio: str) -> List[Dict]:
+    """
+    Pipeline MongoDB da série mensal de pedidos (ordenada por mês) na janela iniciada em `inicio`.
+    """
+    return [
+        {"$match": {"ultima_atualizacao": {"$gte": inicio}}},
+        {"$group": {"_id": _mongodb_ano_mes("$ultima_atualizacao"), "total_pedidos": {"$sum": 1}}},
+        {"$project": {"ano_mes": "$_id", "total_pedidos": 1, "_id": 0}},
+        {"$sort": {"ano_mes": 1}}
+    ]
+
+def _rolling_start(inicio: str) -> str:
+    # Primeiro dia com avaliações que entram na média móvel do dia `inicio`
+    return (date.fromisoformat(inicio) - timedelta(days=ROLLING_DAYS - 1)).isoformat()
+
+def mysql_avaliacao_movel_30d_por_produto_query(inicio: str) -> str:
+    """
+    Retorna a query SQL da média móvel de 30 dias das avaliações de cada produto, por dia
+    (dias com avaliações a partir de `inicio`), ordenada por produto e dia.
+    """
+    return f"""
+    WITH diario AS (
+        SELECT
+            a.produto_id,
+            CAST(a.data AS DATE) AS dia,
+            SUM(a.avaliacao) AS soma_avaliacoes,
+            COUNT(*) AS qtd_avaliacoes
+        FROM avaliacoes a
+        WHERE a.data >= '{_rolling_start(inicio)}'
+        GROUP BY a.produto_id, CAST(a.data AS DATE)
+    ),
+    movel AS (
+        SELECT
+            produto_id,
+            dia,
+            SUM(soma_avaliacoes) OVER janela / SUM(qtd_avaliacoes) OVER janela AS media_avaliacao,
+            SUM(qtd_avaliacoes) OVER janela AS total_avaliacoes
+        FROM diario
+        WINDOW janela AS (
+            PARTITION BY produto_id
+            ORDER BY dia
+            RANGE BETWEEN INTERVAL {ROLLING_DAYS - 1} DAY PRECEDING AND CURRENT ROW
+        )
+    )
+    SELECT produto_id, dia, media_avaliacao, total_avaliacoes
+    FROM movel
+    WHERE dia >= '{inicio}'
+    ORDER BY produto_id, dia;
+    """
+
+def mongodb_avaliacao_movel_30d_por_produto_pipeline(inicio: str) -> List[Dict]:
+    """
+    Pipeline MongoDB da média móvel de 30 dias das avaliações de cada produto, por dia.
+    """
+    return [
+        {"$match": {"data": {"$gte": _rolling_start(inicio)}}},
+        {
+            "$group": {
+                "_id": {"produto_id": "$produto_id", "dia": {"$substrCP": ["$data", 0, 10]}},
+                "soma_avaliacoes": {"$sum": "$avaliacao"},
+                "qtd_avaliacoes": {"$sum": 1}
+            }
+        },
+        {
+            "$project": {
+                "produto_id": "$_id.produto_id",
+                "dia": "$_id.dia",
+                "soma_avaliacoes": 1,
+                "qtd_avaliacoes": 1,
+                "_id": 0
+            }
+        },
+        *_mongodb_media_movel_stages(inicio)
+    ]
+
+def _mongodb_media_movel_stages(inicio: str) -> List[Dict]:
+    # Recebe soma e quantidade diárias por produto; a janela por intervalo exige um campo do tipo data
+    janela = {"range": [-(ROLLING_DAYS - 1), 0], "unit": "day"}
+    return [
+        {"$set": {"dia_data": {"$dateFromString": {"dateString": "$dia"}}}},
+        {
+            "$setWindowFields": {
+                "partitionBy": "$produto_id",
+                "sortBy": {"dia_data": 1},
+                "output": {
+                    "soma_janela": {"$sum": "$soma_avaliacoes", "window": janela},
+                    "total_avaliacoes": {"$sum": "$qtd_avaliacoes", "window": janela}
+                }
+            }
+        },
+        {"$match": {"dia": {"$gte": inicio}}},
+        {
+            "$project": {
+                "produto_id": 1,
+                "dia": 1,
+                "media_avaliacao": {"$divide": ["$soma_janela", "$total_avaliacoes"]},
+                "total_avaliacoes": 1,
+                "_id": 0
+            }
+        },
+        {"$sort": {"produto_id": 1, "dia": 1}}
+    ]
+
+# Pré-agregação em buckets diários no MongoDB: carts_diario (receita e pedidos por dia)
+# e reviews_diario (soma e contagem de avaliações por produto e dia), mantidas com $merge.
+
+def mongodb_carts_diario_build_pipeline() -> List[Dict]:
+    """
+    Pipeline que agrega os carrinhos em buckets diários na coleção carts_diario.
+    """
+    return [
+        {
+            "$group": {
+                "_id": {"$substrCP": ["$ultima_atualizacao", 0, 10]},
+                "receita": {
+                    "$sum": {
+                        "$sum": {
+                            "$map": {
+                                "input": "$itens",
+                                "in": {"$multiply": ["$$this.quantidade", "$$this.preco_unitario"]}
+                            }
+                        }
+                    }
+                },
+                "pedidos": {"$sum": 1}
+            }
+        },
+        {"$merge": {"into": "carts_diario", "whenMatched": "replace", "whenNotMatched": "insert"}}
+    ]
+
+def mongodb_reviews_diario_build_pipeline() -> List[Dict]:
+    """
+    Pipeline que agrega as avaliações em buckets diários por produto na coleção reviews_diario.
+    """
+    return [
+        {
+            "$group": {
+                "_id": {"produto_id": "$produto_id", "dia": {"$substrCP": ["$data", 0, 10]}},
+                "soma_avaliacoes": {"$sum": "$avaliacao"},
+                "total_avaliacoes": {"$sum": 1}
+            }
+        },
+        {"$set": {"produto_id": "$_id.produto_id", "dia": "$_id.dia"}},
+        {"$merge": {"into": "reviews_diario", "whenMatched": "replace", "whenNotMatched": "insert"}}
+    ]
+
+def mongodb_receita_diaria_buckets_pipeline(inicio: str) -> List[Dict]:
+    """
+    Dias de maior receita a partir dos buckets de carts_diario.
+    """
+    return [
+        {"$match": {"_id": {"$gte": inicio}}},
+        {"$project": {"dia": "$_id", "receita": 1, "_id": 0}},
+        {"$sort": {"receita": -1}},
+        {"$limit": 10}
+    ]
+
+def mongodb_pedidos_por_mes_buckets_pipeline(inicio: str) -> List[Dict]:
+    """
+    Série mensal de pedidos a partir dos buckets de carts_diario.
+    """
+    return [
+        {"$match": {"_id": {"$gte": inicio}}},
+        {"$group": {"_id": _mongodb_ano_mes("$_id"), "total_pedidos": {"$sum": "$pedidos"}}},
+        {"$project": {"ano_mes": "$_id", "total_pedidos": 1, "_id": 0}},
+        {"$sort": {"ano_mes": 1}}
+    ]
+
+def mongodb_avaliacao_movel_30d_por_produto_buckets_pipeline(inicio: str) -> List[Dict]:
+    """
+    Média móvel de 30 dias das avaliações de cada produto, por dia, a partir dos buckets de reviews_diario.
+    """
+    return [
+        {"$match": {"dia": {"$gte": _rolling_start(inicio)}}},
+        {
+            "$project": {
+                "produto_id": 1,
+                "dia": 1,
+                "soma_avaliacoes": 1,
+                "qtd_avaliacoes": "$total_avaliacoes",
+                "_id": 0
+            }
+        },
+        *_mongodb_media_movel_stages(inicio)
+    ]
+
+# Coleções de buckets: nome -> (coleção de origem, pipeline de construção, índices)
+MONGODB_TIME_BUCKETS = {
+    "carts_diario": ("carts", mongodb_carts_diario_build_pipeline, []),
+    "reviews_diario": ("reviews", mongodb_reviews_diario_build_pipeline, [[("dia", 1), ("produto_id", 1)]]),
+}
+
+# Índices de data nas coleções brutas: coleção -> campo
+MONGODB_DATE_INDEXES = {
+    "carts": "ultima_atualizacao",
+    "reviews": "data",
+}
+
+# label -> (consulta MySQL, coleção MongoDB, pipeline MongoDB, coleção de buckets, pipeline sobre buckets)
+TIME_WINDOW_QUERIES = {
+    "receita_diaria": (
+        mysql_receita_diaria_query,
+        "carts",
+        mongodb_receita_diaria_pipeline,
+        "carts_diario",
+        mongodb_receita_diaria_buckets_pipeline,
+    ),
+    "pedidos_por_mes": (
+        mysql_pedidos_por_mes_query,
+        "carts",
+        mongodb_pedidos_por_mes_pipeline,
+        "carts_diario",
+        mongodb_pedidos_por_mes_buckets_pipeline,
+    ),
+    "avaliacao_movel_30d_por_produto": (
+        mysql_avaliacao_movel_30d_por_produto_query,
+        "reviews",
+        mongodb_avaliacao_movel_30d_por_produto_pipeline,
+        "reviews_diario",
+        mongodb_avaliacao_movel_30d_por_produto_buckets_pipeline,
+    ),
+}
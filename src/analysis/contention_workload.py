@@ -0,0 +1,309 @@
+import os
+import sys
+import time
+import random
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from loguru import logger
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from services.mongo_handler import MongoDBClient
+from services.mysql_handler import MySQLClient
+from etl.mongo_models import dataset_documents
+from analysis.benchmark import append_results, load_mysql_tables
+from analysis.comparison_queries import (
+    mysql_total_pedidos_por_cliente_query,
+    mongodb_total_pedidos_por_cliente_pipeline,
+    mysql_total_vendido_por_produto_query,
+    mongodb_total_vendido_por_produto_pipeline,
+    mysql_avg_gasto_por_cliente_query,
+    mongodb_avg_gasto_por_cliente_pipeline
+)
+
+BENCHMARK_PATH = "data/csv/benchmarks"
+CONTENTION_FILE = os.path.join(BENCHMARK_PATH, "contention_results.csv")
+CONTENTION_DB = "ecommerce_contention"
+
+DURATION = 20.0
+READERS = 4
+# Quantidades de escritores por cenário; o cenário sem escritores (baseline) sempre é executado
+WRITER_COUNTS: Tuple[int, ...] = (0, 1, 4, 16)
+HOT_KEYS = 50
+
+MYSQL_DEADLOCK = 1213
+MYSQL_LOCK_WAIT_TIMEOUT = 1205
+
+MYSQL_READS = (
+    mysql_total_pedidos_por_cliente_query,
+    mysql_total_vendido_por_produto_query,
+    mysql_avg_gasto_por_cliente_query,
+)
+MONGO_READS = (
+    mongodb_total_pedidos_por_cliente_pipeline,
+    mongodb_total_vendido_por_produto_pipeline,
+    mongodb_avg_gasto_por_cliente_pipeline,
+)
+
+
+class WorkloadStats:
+    """
+    Acumula, de forma thread-safe, as métricas de leitores e escritores.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.read_latencies: List[float] = []
+        self.writes = 0
+        self.errors: Dict[str, int] = {"deadlocks": 0, "lock_wait_timeouts": 0, "write_conflicts": 0, "outros": 0}
+        self.error_types: Counter = Counter()
+
+    def add_read(self, latency: float) -> None:
+        with self.lock:
+            self.read_latencies.append(latency)
+
+    def add_write(self) -> None:
+        with self.lock:
+            self.writes += 1
+
+    def add_error(self, kind: str, error: Exception) -> None:
+        name = type(error).__name__
+        with self.lock:
+            self.errors[kind] += 1
+            self.error_types[name] += 1
+            first = self.error_types[name] == 1
+        if first:
+            logger.warning(f"Erro no workload ({kind}): {name}: {error}")
+
+
+def _run_threads(readers: int, writers: int, read_fn: Callable[[], None], write_fn: Callable[[random.Random], None],
+                 duration: float, stats: WorkloadStats, classify: Callable[[Exception], str]) -> None:
+    # Qualquer exceção é contabilizada como erro e a thread continua, para que falhas
+    # (timeout do pool, rede) não encerrem threads silenciosamente e distorçam as métricas.
+    deadline = time.perf_counter() + duration
+
+    def reader() -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                read_fn()
+            except Exception as e:
+                stats.add_error("outros", e)
+                continue
+            stats.add_read(time.perf_counter() - start)
+
+    def writer(seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            try:
+                write_fn(rng)
+            except Exception as e:
+                stats.add_error(classify(e), e)
+                continue
+            stats.add_write()
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(seed,)) for seed in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _mongo_write_conflicts(client: MongoDBClient) -> int:
+    status = client.client.admin.command("serverStatus")
+    return int(status.get("metrics", {}).get("operation", {}).get("writeConflicts", 0))
+
+
+def _mysql_lock_status(client: MySQLClient) -> Dict[str, int]:
+    with client.engine.connect() as conn:
+        rows = conn.execute(text(
+            "SHOW GLOBAL STATUS WHERE Variable_name IN ('Innodb_row_lock_waits', 'Innodb_row_lock_time')"
+        )).all()
+    return {name: int(value) for name, value in rows}
+
+
+def run_mongo_workload(client: MongoDBClient, dataset: Dict[str, pa.Table], readers: int, writers: int,
+                       duration: float, hot_keys: int) -> Dict[str, Any]:
+    """
+    Executa leitores (relatórios top 10) e escritores (atualizações de carrinhos) concorrentes no MongoDB.
+    """
+    pedido_ids = dataset["carts"].column("pedido_id").to_pylist()[:hot_keys]
+    produtos = dataset["products"].to_pylist()
+    stats = WorkloadStats()
+    carts = client.db["carts"]
+
+    def read() -> None:
+        for pipeline_fn in MONGO_READS:
+            list(carts.aggregate(pipeline_fn()))
+
+    def write(rng: random.Random) -> None:
+        pedido_id = rng.choice(pedido_ids)
+        agora = {"ultima_atualizacao": datetime.now().isoformat()}
+        op = rng.random()
+        if op < 0.4:
+            produto = rng.choice(produtos)
+            carts.update_one({"pedido_id": pedido_id}, {
+                "$push": {"itens": {"produto_id": produto["id"], "quantidade": 1, "preco_unitario": produto["preco"]}},
+                "$set": agora,
+            })
+        elif op < 0.8:
+            carts.update_one({"pedido_id": pedido_id}, {"$inc": {"itens.0.quantidade": 1}, "$set": agora})
+        else:
+            carts.update_one({"pedido_id": pedido_id}, {"$set": agora})
+
+    # Write conflicts vêm apenas do serverStatus: o servidor os repete internamente e eles
+    # não chegam ao cliente como exceção; exceções de escrita contam como 'outros'.
+    conflicts_before = _mongo_write_conflicts(client)
+    _run_threads(readers, writers, read, write, duration, stats, classify=lambda e: "outros")
+    stats.errors["write_conflicts"] = _mongo_write_conflicts(client) - conflicts_before
+    return {"stats": stats, "lock_waits": None, "lock_time_ms": None}
+
+
+def _classify_mysql_error(error: Exception) -> str:
+    if isinstance(error, OperationalError):
+        code = error.orig.args[0] if error.orig is not None and error.orig.args else None
+        if code == MYSQL_DEADLOCK:
+            return "deadlocks"
+        if code == MYSQL_LOCK_WAIT_TIMEOUT:
+            return "lock_wait_timeouts"
+    return "outros"
+
+
+def run_mysql_workload(client: MySQLClient, tables: Dict[str, pd.DataFrame], readers: int, writers: int,
+                       duration: float, hot_keys: int) -> Dict[str, Any]:
+    """
+    Executa leitores (relatórios top 10) e escritores (transações sobre pedidos/itens_pedido) concorrentes no MySQL.
+    Usa uma engine própria com uma conexão por thread, para que a espera medida seja a de locks
+    do InnoDB e não a de checkout no pool padrão do SQLAlchemy (5 + 10 conexões).
+    """
+    engine = create_engine(client.uri, pool_size=max(1, readers + writers), max_overflow=0)
+    pedido_ids = tables["pedidos"]["id"].astype(int).tolist()[:hot_keys]
+    produto_ids = tables["produtos"]["id"].astype(int).tolist()
+    stats = WorkloadStats()
+
+    def read() -> None:
+        with engine.connect() as conn:
+            for query_fn in MYSQL_READS:
+                conn.execute(text(query_fn())).all()
+
+    def write(rng: random.Random) -> None:
+        pedido_id = rng.choice(pedido_ids)
+        op = rng.random()
+        with engine.begin() as conn:
+            if op < 0.4:
+                conn.execute(text(
+                    "INSERT INTO itens_pedido (pedido_id, produto_id, quantidade, preco_unitario) "
+                    "SELECT :pedido_id, id, 1, preco FROM produtos WHERE id = :produto_id "
+                    "ON DUPLICATE KEY UPDATE quantidade = quantidade + 1"
+                ), {"pedido_id": pedido_id, "produto_id": rng.choice(produto_ids)})
+            elif op < 0.8:
+                conn.execute(text(
+                    "UPDATE itens_pedido SET quantidade = quantidade + 1 "
+                    "WHERE pedido_id = :pedido_id ORDER BY produto_id LIMIT 1"
+                ), {"pedido_id": pedido_id})
+            conn.execute(text("UPDATE pedidos SET data_pedido = NOW() WHERE id = :pedido_id"), {"pedido_id": pedido_id})
+
+    status_before = _mysql_lock_status(client)
+    try:
+        _run_threads(readers, writers, read, write, duration, stats, classify=_classify_mysql_error)
+    finally:
+        engine.dispose()
+    status_after = _mysql_lock_status(client)
+    return {
+        "stats": stats,
+        "lock_waits": status_after["Innodb_row_lock_waits"] - status_before["Innodb_row_lock_waits"],
+        "lock_time_ms": status_after["Innodb_row_lock_time"] - status_before["Innodb_row_lock_time"],
+    }
+
+
+def _reset_mongo(client: MongoDBClient, dataset: Dict[str, pa.Table]) -> None:
+    documents = dataset_documents("referenced", dataset)
+    client.drop_collections(list(documents))
+    for collection, docs in documents.items():
+        client.insert_many(collection, docs)
+    client.db["carts"].create_index("pedido_id")
+
+
+def run_contention_benchmark(
+    dataset: Dict[str, pa.Table],
+    tables: Dict[str, pd.DataFrame],
+    writer_counts: Tuple[int, ...] = WRITER_COUNTS,
+    readers: int = READERS,
+    duration: float = DURATION,
+    hot_keys: int = HOT_KEYS,
+) -> pd.DataFrame:
+    """
+    Simula atividade de carrinhos ao vivo: escritores adicionam itens, incrementam quantidades
+    e atualizam ultima_atualizacao/data_pedido enquanto leitores executam os relatórios top 10.
+    A quantidade de leitores é fixa e apenas a de escritores varia; a degradação da latência
+    de leitura é medida em relação ao cenário sem escritores (sempre executado primeiro, com
+    os mesmos leitores). Também registra a vazão de escrita, lock waits e deadlocks (MySQL)
+    ou write conflicts (MongoDB).
+
+    O MongoDB usa um banco próprio (ecommerce_contention); no MySQL as tabelas são
+    recarregadas ao final para desfazer as escritas. O marcador de carga da pipeline é removido
+    junto com as tabelas; cabe a quem chama regravá-lo com a chave das tabelas carregadas.
+
+    Args:
+        dataset (Dict[str, pa.Table]): Tabelas Arrow do dataset gerado.
+        tables (Dict[str, pd.DataFrame]): Tabelas transformadas.
+        writer_counts (Tuple[int, ...]): Quantidades de escritores por cenário.
+        readers (int): Quantidade fixa de leitores em todos os cenários.
+        duration (float): Duração de cada cenário, em segundos.
+        hot_keys (int): Quantidade de carrinhos/pedidos disputados pelos escritores.
+
+    Returns:
+        pd.DataFrame: Resultados por banco e quantidade de escritores.
+    """
+    logger.info("⚔️ Iniciando workload de contenção leitura/escrita...")
+    mongodb = MongoDBClient()
+    mongodb.connect(CONTENTION_DB)
+    mysql = MySQLClient()
+
+    resultados = []
+    for banco, reset, workload in (
+        ("MongoDB", lambda: _reset_mongo(mongodb, dataset), lambda r, w: run_mongo_workload(mongodb, dataset, r, w, duration, hot_keys)),
+        ("MySQL", lambda: load_mysql_tables(mysql, tables), lambda r, w: run_mysql_workload(mysql, tables, r, w, duration, hot_keys)),
+    ):
+        baseline_p50 = None
+        for writers in sorted(set(writer_counts) | {0}):
+            reset()
+            result = workload(readers, writers)
+            stats: WorkloadStats = result["stats"]
+
+            latencies = np.array(stats.read_latencies)
+            p50 = float(np.percentile(latencies, 50)) if len(latencies) else float("nan")
+            if writers == 0:
+                baseline_p50 = p50
+            resultados.append({
+                "banco": banco,
+                "proporcao_leitura": readers / (readers + writers),
+                "leitores": readers,
+                "escritores": writers,
+                "leituras": len(latencies),
+                "leitura_p50": p50,
+                "leitura_p95": float(np.percentile(latencies, 95)) if len(latencies) else float("nan"),
+                "degradacao_leitura": p50 / baseline_p50 if baseline_p50 else float("nan"),
+                "escritas_por_segundo": stats.writes / duration,
+                "lock_waits": result["lock_waits"],
+                "lock_time_ms": result["lock_time_ms"],
+                **stats.errors,
+                "tipos_erros": ", ".join(f"{name}={count}" for name, count in stats.error_types.items()) or None,
+            })
+            logger.info(f"{banco} leitores={readers} escritores={writers}: {resultados[-1]}")
+
+    load_mysql_tables(mysql, tables)
+    mongodb.client.close()
+
+    os.makedirs(BENCHMARK_PATH, exist_ok=True)
+    df_new = append_results(resultados, CONTENTION_FILE)
+    logger.success("✅ Workload de contenção concluído e salvo com sucesso.")
+    return df_new
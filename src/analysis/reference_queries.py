@@ -0,0 +1,191 @@
+from typing import Callable, Dict, List, Tuple, Union
+import numpy as np
+import pandas as pd
+from analysis.comparison_queries import ROLLING_DAYS
+
+# Implementações de referência (NumPy/pandas, em memória) das consultas de comparison_queries.py.
+# Cada função retorna o resultado completo (todas as chaves), usado para validar o top 10
+# dos bancos mesmo com empates no corte, ou a série inteira nas consultas de SERIES_QUERIES.
+
+
+def _valor_itens(itens_pedido: pd.DataFrame) -> np.ndarray:
+    # Preços ficam em float32 nos DataFrames; arredonda para os centavos do DECIMAL(10,2)
+    preco = itens_pedido["preco_unitario"].to_numpy(dtype=np.float64).round(2)
+    return itens_pedido["quantidade"].to_numpy(dtype=np.float64) * preco
+
+
+def reference_total_pedidos_por_cliente(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Total de pedidos por cliente via np.bincount.
+    """
+    clientes, pedidos = tables["clientes"], tables["pedidos"]
+    ids = clientes["id"].to_numpy(dtype=np.int64)
+    counts = np.bincount(pedidos["cliente_id"].to_numpy(dtype=np.int64), minlength=ids.max() + 1)
+    return pd.DataFrame({
+        "cliente_id": ids,
+        "nome": clientes["nome"].astype(str).to_numpy(),
+        "total_pedidos": counts[ids],
+    })
+
+
+def reference_total_vendido_por_produto(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Total vendido (quantidade) por produto via np.bincount ponderado.
+    """
+    produtos, itens = tables["produtos"], tables["itens_pedido"]
+    ids = produtos["id"].to_numpy(dtype=np.int64)
+    vendido = np.bincount(
+        itens["produto_id"].to_numpy(dtype=np.int64),
+        weights=itens["quantidade"].to_numpy(dtype=np.float64),
+        minlength=ids.max() + 1,
+    )
+    return pd.DataFrame({
+        "produto_id": ids,
+        "nome": produtos["nome"].astype(str).to_numpy(),
+        "total_vendido": vendido[ids],
+    })
+
+
+def reference_avg_gasto_por_cliente(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Média de gasto por pedido de cada cliente: soma dos gastos dividida pela contagem de pedidos.
+    """
+    clientes, pedidos, itens = tables["clientes"], tables["pedidos"], tables["itens_pedido"]
+    ids = clientes["id"].to_numpy(dtype=np.int64)
+    pedido_ids = pedidos["id"].to_numpy(dtype=np.int64)
+    pedido_cliente = np.zeros(pedido_ids.max() + 1, dtype=np.int64)
+    pedido_cliente[pedido_ids] = pedidos["cliente_id"].to_numpy(dtype=np.int64)
+
+    cliente_dos_itens = pedido_cliente[itens["pedido_id"].to_numpy(dtype=np.int64)]
+    gasto = np.bincount(cliente_dos_itens, weights=_valor_itens(itens), minlength=ids.max() + 1)
+    qtd_pedidos = np.bincount(pedido_cliente[pedido_ids], minlength=ids.max() + 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        media = np.where(qtd_pedidos[ids] > 0, gasto[ids] / qtd_pedidos[ids], np.nan)
+    return pd.DataFrame({
+        "cliente_id": ids,
+        "nome": clientes["nome"].astype(str).to_numpy(),
+        "media_gasto": media,
+    })
+
+
+# Janelas das consultas de tempo: label -> (tabela, coluna de data, tamanho, unidade 'D' ou 'M').
+# A janela termina no dia mais recente dos dados e é alinhada ao início do dia (ou do mês).
+TIME_WINDOWS: Dict[str, Tuple[str, str, int, str]] = {
+    "receita_diaria": ("pedidos", "data_pedido", 90, "D"),
+    "pedidos_por_mes": ("pedidos", "data_pedido", 6, "M"),
+    "avaliacao_movel_30d_por_produto": ("avaliacoes", "data", 30, "D"),
+}
+
+
+def window_start(tables: Dict[str, pd.DataFrame], label: str) -> str:
+    """
+    Calcula o início ('YYYY-MM-DD') da janela de tempo de uma consulta a partir da data
+    mais recente da tabela, para que todos os motores filtrem pela mesma constante.
+    """
+    table, column, size, unit = TIME_WINDOWS[label]
+    fim = pd.Timestamp(tables[table][column].max())
+    if unit == "M":
+        inicio = (fim.to_period("M") - (size - 1)).start_time
+    else:
+        inicio = fim.normalize() - pd.Timedelta(days=size - 1)
+    return inicio.strftime("%Y-%m-%d")
+
+
+def reference_receita_diaria(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Receita por dia na janela de receita_diaria, com a data do pedido propagada aos itens por indexação.
+    """
+    pedidos, itens = tables["pedidos"], tables["itens_pedido"]
+    pedido_ids = pedidos["id"].to_numpy(dtype=np.int64)
+    data_por_pedido = np.empty(pedido_ids.max() + 1, dtype="datetime64[ns]")
+    data_por_pedido[pedido_ids] = pedidos["data_pedido"].to_numpy(dtype="datetime64[ns]")
+
+    data_itens = data_por_pedido[itens["pedido_id"].to_numpy(dtype=np.int64)]
+    na_janela = data_itens >= np.datetime64(window_start(tables, "receita_diaria"))
+    receita = pd.DataFrame({
+        "dia": data_itens[na_janela].astype("datetime64[D]").astype(str),
+        "receita": _valor_itens(itens)[na_janela],
+    })
+    return receita.groupby("dia", as_index=False)["receita"].sum()
+
+
+def reference_pedidos_por_mes(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Contagem de pedidos por mês (YYYYMM) na janela de pedidos_por_mes.
+    """
+    datas = tables["pedidos"]["data_pedido"]
+    datas = datas[datas >= pd.Timestamp(window_start(tables, "pedidos_por_mes"))]
+    ano_mes = (datas.dt.year * 100 + datas.dt.month).to_numpy(dtype=np.int64)
+    meses, contagens = np.unique(ano_mes, return_counts=True)
+    return pd.DataFrame({"ano_mes": meses, "total_pedidos": contagens})
+
+
+def reference_avaliacao_movel_30d_por_produto(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Média móvel de 30 dias das avaliações de cada produto, por dia com avaliações na janela.
+    As somas diárias são acumuladas por (produto, dia) e o início de cada janela móvel é
+    localizado com np.searchsorted sobre a chave combinada produto << 32 | dia.
+    """
+    avaliacoes = tables["avaliacoes"]
+    inicio = np.datetime64(window_start(tables, "avaliacao_movel_30d_por_produto"), "D")
+    dias = avaliacoes["data"].to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    historico = dias >= inicio - np.timedelta64(ROLLING_DAYS - 1, "D")
+    # Avaliações ficam em float32 nos DataFrames; arredonda para a casa decimal do DECIMAL(2,1)
+    diario = pd.DataFrame({
+        "produto_id": avaliacoes["produto_id"].to_numpy(dtype=np.int64)[historico],
+        "dia": dias[historico],
+        "nota": avaliacoes["avaliacao"].to_numpy(dtype=np.float64).round(1)[historico],
+    }).groupby(["produto_id", "dia"], as_index=False).agg(soma=("nota", "sum"), total=("nota", "size"))
+
+    dia = diario["dia"].to_numpy(dtype="datetime64[D]")
+    chave = (diario["produto_id"].to_numpy(dtype=np.int64) << 32) | dia.astype(np.int64)
+    primeiro = np.searchsorted(chave, chave - (ROLLING_DAYS - 1), side="left")
+    soma = np.concatenate(([0.0], np.cumsum(diario["soma"].to_numpy(dtype=np.float64))))
+    total = np.concatenate(([0], np.cumsum(diario["total"].to_numpy(dtype=np.int64))))
+    soma_janela = soma[1:] - soma[primeiro]
+    total_janela = total[1:] - total[primeiro]
+
+    na_janela = dia >= inicio
+    return pd.DataFrame({
+        "produto_id": diario["produto_id"].to_numpy()[na_janela],
+        "dia": dia[na_janela].astype(str),
+        "media_avaliacao": soma_janela[na_janela] / total_janela[na_janela],
+        "total_avaliacoes": total_janela[na_janela],
+    })
+
+
+# label -> (função de referência, coluna(s) chave, coluna métrica)
+REFERENCE_QUERIES: Dict[
+    str, Tuple[Callable[[Dict[str, pd.DataFrame]], pd.DataFrame], Union[str, List[str]], str]
+] = {
+    "total_pedidos_por_cliente": (reference_total_pedidos_por_cliente, "cliente_id", "total_pedidos"),
+    "total_vendido_por_produto": (reference_total_vendido_por_produto, "produto_id", "total_vendido"),
+    "avg_gasto_por_cliente": (reference_avg_gasto_por_cliente, "cliente_id", "media_gasto"),
+    "receita_diaria": (reference_receita_diaria, "dia", "receita"),
+    "pedidos_por_mes": (reference_pedidos_por_mes, "ano_mes", "total_pedidos"),
+    "avaliacao_movel_30d_por_produto": (
+        reference_avaliacao_movel_30d_por_produto, ["produto_id", "dia"], "media_avaliacao"
+    ),
+}
+
+# Consultas que retornam a série completa ordenada pelas colunas chave, em vez do top 10
+SERIES_QUERIES: Tuple[str, ...] = ("pedidos_por_mes", "avaliacao_movel_30d_por_produto")
+
+
+def top_n(df: pd.DataFrame, metric: str, n: int = 10) -> pd.DataFrame:
+    """
+    Ordena pelo valor da métrica (decrescente, nulos ao final) e retorna as n primeiras linhas.
+    """
+    return df.sort_values(metric, ascending=False, na_position="last", kind="stable").head(n).reset_index(drop=True)
+
+
+def expected_result(label: str, reference: pd.DataFrame) -> pd.DataFrame:
+    """
+    Resultado esperado de um motor para a consulta: a série ordenada pelas chaves
+    (SERIES_QUERIES) ou o top 10 pela métrica.
+    """
+    _, key, metric = REFERENCE_QUERIES[label]
+    if label in SERIES_QUERIES:
+        return reference.sort_values(key, kind="stable").reset_index(drop=True)
+    return top_n(reference, metric)
@@ -0,0 +1,212 @@
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from analysis.reference_queries import REFERENCE_QUERIES, SERIES_QUERIES, expected_result, top_n
+
+BENCHMARK_PATH = "data/csv/benchmarks"
+BENCHMARK_FILE = os.path.join(BENCHMARK_PATH, "benchmark_results.csv")
+VERIFICATION_FILE = os.path.join(BENCHMARK_PATH, "verification_results.csv")
+
+ENGINES = ("mysql", "mongodb", "duckdb", "pandas")
+BANCO_ENGINE = {"MySQL": "mysql", "MongoDB": "mongodb", "DuckDB": "duckdb", "pandas": "pandas"}
+
+# Arquivo de resultados -> função que mapeia cada linha para o CSV de resultado da consulta
+RESULT_FILES: Dict[str, Callable[[pd.Series], str]] = {
+    BENCHMARK_FILE: lambda row: f"{BANCO_ENGINE.get(row['banco'], '')}_{row['query']}.csv",
+    os.path.join(BENCHMARK_PATH, "mongo_models_results.csv"): lambda row: f"mongodb_{row['modelo']}_{row['query']}.csv",
+    os.path.join(BENCHMARK_PATH, "mysql_profiles_results.csv"): lambda row: f"mysql_{row['perfil']}_{row['query']}.csv",
+    os.path.join(BENCHMARK_PATH, "sharding_results.csv"): (
+        lambda row: f"{BANCO_ENGINE.get(row['banco'], '')}_sharded{row['shards']}_{row['query']}.csv"
+    ),
+    os.path.join(BENCHMARK_PATH, "time_window_results.csv"): lambda row: f"mongodb_{row['variante']}_{row['query']}.csv",
+}
+
+# Tolerância para diferenças de arredondamento (DECIMAL x double x float32)
+ATOL = 0.01
+
+
+def parse_result_file(filename: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Identifica motor, variante e consulta a partir do nome de um CSV de resultado
+    (ex.: 'mongodb_embedded_snapshot_avg_gasto_por_cliente.csv').
+
+    Returns:
+        Optional[Tuple[str, str, str]]: (motor, variante, label) ou None se não for um resultado verificável.
+    """
+    name, ext = os.path.splitext(filename)
+    if ext != ".csv":
+        return None
+    for engine in ENGINES:
+        if not name.startswith(f"{engine}_"):
+            continue
+        rest = name[len(engine) + 1:]
+        for label in REFERENCE_QUERIES:
+            if rest == label or rest.endswith(f"_{label}"):
+                return engine, rest[: -len(label)].rstrip("_"), label
+    return None
+
+
+def compare_with_reference(result: pd.DataFrame, reference: pd.DataFrame, key: str, metric: str) -> Optional[str]:
+    """
+    Compara o top 10 de um motor com a referência completa, tolerando empates no corte:
+    cada chave retornada precisa ter a mesma métrica (e nome) da referência, e o conjunto
+    de valores da métrica precisa ser igual ao top 10 da referência.
+
+    Returns:
+        Optional[str]: Motivo da divergência ou None se o resultado for equivalente.
+    """
+    expected = top_n(reference, metric)
+    if key not in result.columns or metric not in result.columns:
+        return f"colunas ausentes (esperado '{key}' e '{metric}')"
+    if len(result) != len(expected):
+        return f"{len(result)} linhas (esperado {len(expected)})"
+
+    merged = result.merge(reference, on=key, how="left", suffixes=("", "_ref"), indicator=True)
+    if (merged["_merge"] != "both").any():
+        return "chaves inexistentes na referência"
+
+    valores = pd.to_numeric(merged[metric]).to_numpy(dtype=np.float64)
+    if not np.allclose(valores, merged[f"{metric}_ref"].to_numpy(dtype=np.float64), atol=ATOL, equal_nan=True):
+        return f"valores de '{metric}' divergentes"
+    if "nome" in result.columns and (merged["nome"].astype(str) != merged["nome_ref"].astype(str)).any():
+        return "nomes divergentes"
+
+    esperados = np.sort(expected[metric].to_numpy(dtype=np.float64))
+    if not np.allclose(np.sort(valores), esperados, atol=ATOL, equal_nan=True):
+        return "top 10 diferente da referência"
+    return None
+
+
+def compare_series(
+    result: pd.DataFrame, reference: pd.DataFrame, key: Union[str, List[str]], metric: str
+) -> Optional[str]:
+    """
+    Compara uma série completa (SERIES_QUERIES) com a referência: as mesmas chaves, na ordem
+    das colunas chave, e os mesmos valores da métrica em cada linha.
+
+    Returns:
+        Optional[str]: Motivo da divergência ou None se o resultado for equivalente.
+    """
+    keys = [key] if isinstance(key, str) else list(key)
+    if any(column not in result.columns for column in keys + [metric]):
+        return f"colunas ausentes (esperado {keys + [metric]})"
+    expected = reference.sort_values(keys, kind="stable").reset_index(drop=True)
+    if len(result) != len(expected):
+        return f"{len(result)} linhas (esperado {len(expected)})"
+
+    for column in keys:
+        if (result[column].astype(str).to_numpy() != expected[column].astype(str).to_numpy()).any():
+            return f"valores de '{column}' divergentes ou fora de ordem"
+    valores = pd.to_numeric(result[metric]).to_numpy(dtype=np.float64)
+    if not np.allclose(valores, expected[metric].to_numpy(dtype=np.float64), atol=ATOL, equal_nan=True):
+        return f"valores de '{metric}' divergentes"
+    return None
+
+
+def run_reference_benchmark(tables: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Executa as implementações de referência em memória, salvando o top 10 (ou a série
+    completa) e o tempo de cada consulta (banco 'pandas') junto aos demais resultados.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Resultado completo de cada consulta de referência.
+    """
+    # Import tardio: analysis.benchmark importa compare_with_reference deste módulo
+    from analysis.benchmark import append_results
+
+    references = {}
+    resultados = []
+    for label, (fn, _, _) in REFERENCE_QUERIES.items():
+        start = time.perf_counter()
+        references[label] = fn(tables)
+        resultado = expected_result(label, references[label])
+        duration = time.perf_counter() - start
+        resultado.to_csv(f"{BENCHMARK_PATH}/pandas_{label}.csv", index=False)
+        logger.success(f"pandas '{label}' executada em {duration:.4f} segundos.")
+        resultados.append({"query": label, "banco": "pandas", "tempo": duration})
+
+    append_results(resultados, BENCHMARK_FILE)
+    return references
+
+
+def verify_benchmark_results(tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Compara com a implementação de referência os CSVs de resultado produzidos pela execução
+    atual (linhas com o run_id de RUN_PARAMS) e marca a coluna 'valido' dessas linhas de tempo.
+    Linhas com resultado divergente são invalidadas para que motores fazendo trabalhos diferentes
+    não sejam comparados. Linhas de execuções anteriores e arquivos que nenhuma linha da execução
+    atual referencia não são verificados nem alterados.
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Tabelas transformadas (clientes, produtos, pedidos, itens_pedido, avaliacoes).
+
+    Returns:
+        pd.DataFrame: Resultado da verificação por arquivo.
+    """
+    from analysis.benchmark import RUN_PARAMS
+
+    logger.info("🔎 Verificando resultados dos benchmarks contra a referência em memória...")
+    references = run_reference_benchmark(tables)
+
+    # Linhas da execução atual em cada arquivo de resultados (todas, se não houver run_id definido)
+    run_id = RUN_PARAMS.get("run_id")
+    resultados = {}
+    for path, to_filename in RESULT_FILES.items():
+        if not os.path.exists(path):
+            continue
+        df = pd.read_csv(path)
+        if run_id and "run_id" in df.columns:
+            atual = df["run_id"].astype(str) == run_id
+        else:
+            atual = pd.Series(True, index=df.index)
+        arquivos = [to_filename(row) for _, row in df[atual].iterrows()]
+        resultados[path] = (df, atual, arquivos)
+    arquivos_atuais = {filename for _, _, arquivos in resultados.values() for filename in arquivos}
+
+    verificacoes = []
+    for filename in sorted(arquivos_atuais):
+        parsed = parse_result_file(filename)
+        if parsed is None or not os.path.exists(os.path.join(BENCHMARK_PATH, filename)):
+            continue
+        engine, variante, label = parsed
+        _, key, metric = REFERENCE_QUERIES[label]
+        compare = compare_series if label in SERIES_QUERIES else compare_with_reference
+        motivo = compare(pd.read_csv(os.path.join(BENCHMARK_PATH, filename)), references[label], key, metric)
+        if motivo:
+            logger.error(f"❌ Resultado divergente em '{filename}': {motivo}.")
+        verificacoes.append({
+            "arquivo": filename,
+            "motor": engine,
+            "variante": variante,
+            "query": label,
+            "valido": motivo is None,
+            "motivo": motivo,
+        })
+
+    df_verificacao = pd.DataFrame(verificacoes, columns=["arquivo", "motor", "variante", "query", "valido", "motivo"])
+    df_verificacao.to_csv(VERIFICATION_FILE, index=False)
+    status = dict(zip(df_verificacao["arquivo"], df_verificacao["valido"]))
+
+    for path, (df, atual, arquivos) in resultados.items():
+        if "valido" in df.columns:
+            valido = df["valido"].astype("boolean")
+        else:
+            valido = pd.Series(pd.NA, index=df.index, dtype="boolean")
+        valido[atual] = pd.array([status.get(filename) for filename in arquivos], dtype="boolean")
+        df["valido"] = valido
+        df.to_csv(path, index=False)
+        invalidos = int((~valido[atual].fillna(True)).sum())
+        if invalidos:
+            logger.warning(f"{invalidos} linha(s) da execução atual invalidada(s) em '{path}'.")
+
+    logger.success(
+        f"✅ Verificação concluída: {int(df_verificacao['valido'].sum())}/{len(df_verificacao)} resultados equivalentes."
+    )
+    return df_verificacao
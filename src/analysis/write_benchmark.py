@@ -0,0 +1,251 @@
+import os
+import re
+import sys
+import time
+from itertools import product
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from loguru import logger
+from pymongo import WriteConcern
+from sqlalchemy import text
+from services.mongo_handler import MongoDBClient
+from services.mysql_handler import MySQLClient
+from analysis.benchmark import append_results
+
+BENCHMARK_PATH = "data/csv/benchmarks"
+WRITE_MATRIX_FILE = os.path.join(BENCHMARK_PATH, "write_matrix_results.csv")
+
+BATCH_SIZES: Tuple[int, ...] = (100, 1000, 5000)
+
+MONGO_ORDERED: Tuple[bool, ...] = (True, False)
+MONGO_WRITE_CONCERNS: Dict[str, WriteConcern] = {
+    "w1": WriteConcern(w=1),
+    "w1_journal": WriteConcern(w=1, j=True),
+    "majority": WriteConcern(w="majority"),
+    "majority_journal": WriteConcern(w="majority", j=True),
+}
+
+# per_row: commit a cada linha | per_batch: uma transação por lote | single: uma transação para tudo
+MYSQL_TRANSACTIONS: Tuple[str, ...] = ("per_row", "per_batch", "single")
+# None/multi: DataFrame.to_sql | bulk: executemany do driver (INSERT multi-linha do PyMySQL)
+MYSQL_METHODS: Tuple[Optional[str], ...] = (None, "multi", "bulk")
+
+
+def _batches(items: Sequence[Any], batch_size: int) -> List[Sequence[Any]]:
+    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+
+
+def _summary(latencies: List[float], total: float, count: int) -> Dict[str, float]:
+    return {
+        "tempo_total": total,
+        "registros_por_segundo": count / total if total > 0 else float("nan"),
+        "p99_lote": float(np.percentile(latencies, 99)) if latencies else float("nan"),
+    }
+
+
+def benchmark_mongo_writes(
+    client: MongoDBClient,
+    collection_name: str,
+    documents: List[Dict[str, Any]],
+    batch_sizes: Tuple[int, ...] = BATCH_SIZES,
+    ordered_options: Tuple[bool, ...] = MONGO_ORDERED,
+    write_concerns: Optional[Dict[str, WriteConcern]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Mede a escrita de documentos em uma coleção temporária para cada combinação de
+    tamanho de lote, inserção ordenada/não ordenada e write concern.
+
+    Args:
+        client (MongoDBClient): Cliente conectado.
+        collection_name (str): Coleção de origem dos documentos (usada no nome da coleção temporária).
+        documents (List[Dict[str, Any]]): Documentos a inserir.
+        batch_sizes (Tuple[int, ...]): Tamanhos de lote.
+        ordered_options (Tuple[bool, ...]): Valores de `ordered` no insert_many.
+        write_concerns (Optional[Dict[str, WriteConcern]]): Write concerns por nome.
+
+    Returns:
+        List[Dict[str, Any]]: Uma linha de resultado por combinação.
+    """
+    write_concerns = write_concerns or MONGO_WRITE_CONCERNS
+    scratch = f"bench_write_{collection_name}"
+    resultados = []
+
+    for batch_size, ordered, (wc_name, write_concern) in product(batch_sizes, ordered_options, write_concerns.items()):
+        client.db.drop_collection(scratch)
+        collection = client.db[scratch].with_options(write_concern=write_concern)
+        # Cópias sem _id preparadas fora da medição (insert_many adiciona _id aos dicionários)
+        batches = _batches([{k: v for k, v in doc.items() if k != "_id"} for doc in documents], batch_size)
+
+        latencies = []
+        start = time.perf_counter()
+        for batch in batches:
+            batch_start = time.perf_counter()
+            collection.insert_many(batch, ordered=ordered)
+            latencies.append(time.perf_counter() - batch_start)
+        total = time.perf_counter() - start
+
+        resultado = {
+            "banco": "MongoDB",
+            "destino": collection_name,
+            "batch_size": batch_size,
+            "ordered": ordered,
+            "write_concern": wc_name,
+            "transacao": None,
+            "metodo": None,
+            **_summary(latencies, total, len(documents)),
+        }
+        resultados.append(resultado)
+        logger.info(
+            f"MongoDB '{collection_name}' lote={batch_size} ordered={ordered} wc={wc_name}: "
+            f"{resultado['registros_por_segundo']:.0f} docs/s, p99 {resultado['p99_lote'] * 1000:.2f} ms"
+        )
+
+    client.db.drop_collection(scratch)
+    return resultados
+
+
+def _insert_mysql(conn, df: pd.DataFrame, rows: List[tuple], table_name: str, method: Optional[str]) -> None:
+    if method == "bulk":
+        columns = ", ".join(f"`{c}`" for c in df.columns)
+        placeholders = ", ".join(["%s"] * len(df.columns))
+        conn.exec_driver_sql(f"INSERT INTO `{table_name}` ({columns}) VALUES ({placeholders})", rows)
+    else:
+        df.to_sql(table_name, con=conn, if_exists="append", index=False, method=method)
+
+
+def _scratch_table_ddl(client: MySQLClient, table_name: str, scratch: str) -> str:
+    """
+    Monta o CREATE TABLE da tabela temporária a partir do DDL do perfil 'baseline', sem as
+    chaves estrangeiras: não depende de as tabelas principais já existirem no banco.
+    """
+    pattern = re.compile(rf"CREATE TABLE IF NOT EXISTS {table_name}\s*\(")
+    stmt = next(stmt.strip() for stmt in client._schema_ddl("baseline") if pattern.search(stmt))
+    stmt = pattern.sub(f"CREATE TABLE `{scratch}` (", stmt, count=1)
+    return re.sub(r",\s*FOREIGN KEY \([^)]*\) REFERENCES \w+\(\w+\)", "", stmt)
+
+
+def benchmark_mysql_writes(
+    client: MySQLClient,
+    table_name: str,
+    df: pd.DataFrame,
+    batch_sizes: Tuple[int, ...] = BATCH_SIZES,
+    transactions: Tuple[str, ...] = MYSQL_TRANSACTIONS,
+    methods: Tuple[Optional[str], ...] = MYSQL_METHODS,
+) -> List[Dict[str, Any]]:
+    """
+    Mede a escrita de um DataFrame em uma cópia da tabela (schema 'baseline', sem FKs)
+    para cada combinação de tamanho de lote, granularidade de transação e método de inserção.
+    O modo 'per_row' não depende do tamanho de lote: é executado uma única vez, com lotes de
+    uma linha (batch_size = 1), e apenas no caminho 'bulk', já que to_sql com uma linha por
+    chamada mediria o overhead do pandas e não o do banco.
+
+    Args:
+        client (MySQLClient): Cliente MySQL.
+        table_name (str): Tabela de origem do schema.
+        df (pd.DataFrame): Linhas a inserir.
+        batch_sizes (Tuple[int, ...]): Tamanhos de lote.
+        transactions (Tuple[str, ...]): Granularidades de transação.
+        methods (Tuple[Optional[str], ...]): Métodos de inserção.
+
+    Returns:
+        List[Dict[str, Any]]: Uma linha de resultado por combinação.
+    """
+    scratch = f"bench_write_{table_name}"
+    with client.engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS `{scratch}`"))
+        conn.execute(text(_scratch_table_ddl(client, table_name, scratch)))
+
+    # Tipos nativos do Python para o driver (numpy/Arrow -> int, float, str, Timestamp)
+    all_rows = list(df.astype(object).itertuples(index=False, name=None))
+    resultados = []
+
+    combinations = [
+        (batch_size, transaction, method)
+        for batch_size, transaction, method in product(batch_sizes, transactions, methods)
+        if transaction != "per_row"
+    ]
+    if "per_row" in transactions and "bulk" in methods:
+        combinations.insert(0, (1, "per_row", "bulk"))
+
+    for batch_size, transaction, method in combinations:
+        with client.engine.begin() as conn:
+            conn.execute(text(f"TRUNCATE TABLE `{scratch}`"))
+
+        batches = [
+            (df.iloc[i:i + batch_size], all_rows[i:i + batch_size]) for i in range(0, len(df), batch_size)
+        ]
+        latencies = []
+        start = time.perf_counter()
+        if transaction == "single":
+            with client.engine.begin() as conn:
+                for batch_df, rows in batches:
+                    batch_start = time.perf_counter()
+                    _insert_mysql(conn, batch_df, rows, scratch, method)
+                    latencies.append(time.perf_counter() - batch_start)
+        else:
+            # per_batch e per_row (lotes de uma linha): um commit por lote
+            for batch_df, rows in batches:
+                batch_start = time.perf_counter()
+                with client.engine.begin() as conn:
+                    _insert_mysql(conn, batch_df, rows, scratch, method)
+                latencies.append(time.perf_counter() - batch_start)
+        total = time.perf_counter() - start
+
+        resultado = {
+            "banco": "MySQL",
+            "destino": table_name,
+            "batch_size": batch_size,
+            "ordered": None,
+            "write_concern": None,
+            "transacao": transaction,
+            "metodo": method or "none",
+            **_summary(latencies, total, len(df)),
+        }
+        resultados.append(resultado)
+        logger.info(
+            f"MySQL '{table_name}' lote={batch_size} transação={transaction} método={method}: "
+            f"{resultado['registros_por_segundo']:.0f} linhas/s, p99 {resultado['p99_lote'] * 1000:.2f} ms"
+        )
+
+    with client.engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS `{scratch}`"))
+    return resultados
+
+
+def run_write_benchmark(
+    dataset: Dict[str, pa.Table],
+    tables: Dict[str, pd.DataFrame],
+    batch_sizes: Tuple[int, ...] = BATCH_SIZES,
+) -> pd.DataFrame:
+    """
+    Executa a matriz de escrita no MongoDB (coleções do dataset) e no MySQL (tabelas
+    transformadas) e salva os resultados em write_matrix_results.csv.
+
+    Args:
+        dataset (Dict[str, pa.Table]): Tabelas Arrow por coleção (convertidas em documentos na inserção).
+        tables (Dict[str, pd.DataFrame]): DataFrames por tabela.
+        batch_sizes (Tuple[int, ...]): Tamanhos de lote.
+
+    Returns:
+        pd.DataFrame: Resultados da matriz.
+    """
+    logger.info("✍️ Iniciando matriz de benchmarks de escrita...")
+    mongodb = MongoDBClient()
+    mongodb.connect("ecommerce_write_bench")
+    mysql = MySQLClient()
+
+    resultados = []
+    for collection_name, table in dataset.items():
+        resultados += benchmark_mongo_writes(mongodb, collection_name, table.to_pylist(), batch_sizes)
+    for table_name, df in tables.items():
+        resultados += benchmark_mysql_writes(mysql, table_name, df, batch_sizes)
+
+    os.makedirs(BENCHMARK_PATH, exist_ok=True)
+    df_new = append_results(resultados, WRITE_MATRIX_FILE)
+    logger.success("✅ Matriz de escrita concluída e salva com sucesso.")
+    return df_new
@@ -0,0 +1,111 @@
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Modelos de documentos suportados pela carga no MongoDB:
+#   referenced         -> modelo atual: carts guarda apenas cliente_id (exige $lookup em clients)
+#   embedded_snapshot  -> carts com snapshot de nome/email do cliente embutido
+#   client_embedded    -> um documento por cliente com seus carrinhos embutidos
+MONGO_MODELS = ("referenced", "embedded_snapshot", "client_embedded")
+
+# Coleções produzidas por cada modelo em build_documents
+MODEL_COLLECTIONS: Dict[str, Tuple[str, ...]] = {
+    "referenced": ("clients", "products", "reviews", "carts"),
+    "embedded_snapshot": ("clients", "products", "reviews", "carts"),
+    "client_embedded": ("clients", "products", "reviews"),
+}
+
+# No modelo client_embedded os carrinhos são reconstruídos a partir dos clientes
+# (um documento por carrinho, com cliente_id), no formato da coleção carts
+CLIENT_EMBEDDED_CARTS_PIPELINE: List[Dict] = [
+    {"$unwind": "$carts"},
+    {"$replaceRoot": {"newRoot": {"$mergeObjects": ["$carts", {"cliente_id": "$id"}]}}},
+]
+
+
+def _copy(documents: List[dict]) -> List[dict]:
+    # insert_many adiciona _id aos dicionários; cópias rasas evitam poluir o dataset original
+    return [dict(doc) for doc in documents]
+
+
+def build_documents(
+    model: str,
+    clients: List[dict],
+    products: List[dict],
+    reviews: List[dict],
+    carts: List[dict],
+) -> Dict[str, List[dict]]:
+    """
+    Monta os documentos de cada coleção conforme o modelo de documentos escolhido.
+
+    Args:
+        model (str): Um dos modelos em MONGO_MODELS.
+        clients (List[dict]): Clientes gerados.
+        products (List[dict]): Produtos gerados.
+        reviews (List[dict]): Avaliações geradas.
+        carts (List[dict]): Carrinhos gerados.
+
+    Returns:
+        Dict[str, List[dict]]: Documentos por nome de coleção.
+
+    Raises:
+        ValueError: Se o modelo não for suportado.
+    """
+    if model == "referenced":
+        return {
+            "clients": _copy(clients),
+            "products": _copy(products),
+            "reviews": _copy(reviews),
+            "carts": _copy(carts),
+        }
+
+    if model == "embedded_snapshot":
+        clients_by_id = {c["id"]: c for c in clients}
+        snapshot_carts = []
+        for cart in carts:
+            client = clients_by_id[cart["cliente_id"]]
+            snapshot_carts.append({**cart, "cliente_nome": client["nome"], "cliente_email": client["email"]})
+        return {
+            "clients": _copy(clients),
+            "products": _copy(products),
+            "reviews": _copy(reviews),
+            "carts": snapshot_carts,
+        }
+
+    if model == "client_embedded":
+        carts_by_client: Dict[int, List[dict]] = {c["id"]: [] for c in clients}
+        for cart in carts:
+            carts_by_client[cart["cliente_id"]].append({
+                "pedido_id": cart["pedido_id"],
+                "itens": cart["itens"],
+                "ultima_atualizacao": cart["ultima_atualizacao"],
+            })
+        return {
+            "clients": [{**c, "carts": carts_by_client[c["id"]]} for c in clients],
+            "products": _copy(products),
+            "reviews": _copy(reviews),
+        }
+
+    raise ValueError(f"Modelo de documentos desconhecido: '{model}'. Opções: {MONGO_MODELS}")
+
+
+def dataset_documents(model: str, dataset: Dict[str, "pa.Table"]) -> Dict[str, List[dict]]:
+    """
+    Converte as tabelas Arrow do dataset (ver dataset_cache) em dicionários e monta os
+    documentos do modelo escolhido. A conversão só acontece aqui, na inserção no MongoDB.
+
+    Args:
+        model (str): Um dos modelos em MONGO_MODELS.
+        dataset (Dict[str, pa.Table]): Tabelas Arrow por nome de dataset.
+
+    Returns:
+        Dict[str, List[dict]]: Documentos por nome de coleção.
+    """
+    return build_documents(
+        model,
+        dataset["clients"].to_pylist(),
+        dataset["products"].to_pylist(),
+        dataset["reviews"].to_pylist(),
+        dataset["carts"].to_pylist(),
+    )
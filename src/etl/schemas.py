@@ -0,0 +1,92 @@
+from typing import Dict
+import pandas as pd
+from loguru import logger
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
+# Tipos lógicos usados nos schemas:
+#   uint      -> inteiro sem sinal com downcast (uint8/uint16/uint32)
+#   datetime  -> datetime64[ns], parseado uma única vez a partir de ISO-8601
+#   price     -> float32 (valores com 2 casas decimais, até 7 dígitos significativos)
+#   float32   -> float32
+#   category  -> categórico (poucos valores distintos)
+#   string    -> string Arrow (ou string do pandas se pyarrow não estiver instalado)
+#   object    -> mantido como está (ex.: listas aninhadas de itens)
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    # Coleções do MongoDB
+    "clients": {"id": "uint", "nome": "string", "email": "string", "data_cadastro": "datetime"},
+    "products": {"id": "uint", "nome": "category", "preco": "price"},
+    "reviews": {
+        "produto_id": "uint",
+        "cliente_id": "uint",
+        "avaliacao": "float32",
+        "comentario": "string",
+        "data": "datetime",
+    },
+    "carts": {"pedido_id": "string", "cliente_id": "uint", "itens": "object", "ultima_atualizacao": "datetime"},
+    # Tabelas do modelo relacional
+    "clientes": {"id": "uint", "nome": "string", "email": "string", "data_cadastro": "datetime"},
+    "produtos": {"id": "uint", "nome": "category", "preco": "price"},
+    "pedidos": {"id": "uint", "cliente_id": "uint", "data_pedido": "datetime"},
+    "itens_pedido": {"pedido_id": "uint", "produto_id": "uint", "quantidade": "uint", "preco_unitario": "price"},
+    "avaliacoes": {
+        "id": "uint",
+        "produto_id": "uint",
+        "cliente_id": "uint",
+        "avaliacao": "float32",
+        "comentario": "string",
+        "data": "datetime",
+    },
+}
+
+
+def memory_mb(df: pd.DataFrame) -> float:
+    """
+    Retorna o uso de memória (profundo) de um DataFrame em MB.
+    """
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def _convert(series: pd.Series, kind: str) -> pd.Series:
+    if kind == "uint":
+        return pd.to_numeric(series, downcast="unsigned")
+    if kind == "datetime":
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        return pd.to_datetime(series, format="ISO8601")
+    if kind in ("price", "float32"):
+        return series.astype("float32")
+    if kind == "category":
+        return series.astype("category")
+    if kind == "string":
+        return series.astype(STRING_DTYPE)
+    return series
+
+
+def apply_schema(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    """
+    Converte as colunas de um DataFrame para os tipos compactos definidos em SCHEMAS,
+    registrando no log o uso de memória antes e depois da conversão.
+
+    Colunas ausentes do schema são mantidas sem alteração.
+
+    Args:
+        df (pd.DataFrame): DataFrame a ser convertido.
+        name (str): Nome da coleção/tabela em SCHEMAS.
+
+    Returns:
+        pd.DataFrame: Novo DataFrame com os tipos compactos.
+    """
+    schema = SCHEMAS[name]
+    before = memory_mb(df)
+    columns = {
+        col: _convert(df[col], schema[col]) if col in schema else df[col]
+        for col in df.columns
+    }
+    result = pd.DataFrame(columns, index=df.index, copy=False)
+    logger.info(f"🧮 Tipos de '{name}' compactados: {before:.2f} MB -> {memory_mb(result):.2f} MB")
+    return result
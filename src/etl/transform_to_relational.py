@@ -1,5 +1,7 @@
-from typing import List
+from itertools import chain
+import numpy as np
 import pandas as pd
+from etl.schemas import apply_schema
 
 
 def extract_clients(clients_df: pd.DataFrame) -> pd.DataFrame:
@@ -13,7 +15,7 @@ def extract_clients(clients_df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: DataFrame com colunas id, nome, email, data_cadastro.
     """
     # Assume que o clients_df já está com as colunas corretas
-    return clients_df[['id', 'nome', 'email', 'data_cadastro']].copy()
+    return apply_schema(clients_df[['id', 'nome', 'email', 'data_cadastro']], 'clientes')
 
 
 def extract_products(products_df: pd.DataFrame) -> pd.DataFrame:
@@ -26,7 +28,7 @@ def extract_products(products_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame com colunas id, nome, preco.
     """
-    return products_df[['id', 'nome', 'preco']].copy()
+    return apply_schema(products_df[['id', 'nome', 'preco']], 'produtos')
 
 
 def generate_pedidos_from_carts(carts_df: pd.DataFrame) -> pd.DataFrame:
@@ -39,10 +41,12 @@ def generate_pedidos_from_carts(carts_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame com colunas id, cliente_id, data_pedido.
     """
-    pedidos = carts_df[['cliente_id', 'ultima_atualizacao']].copy()
-    pedidos.rename(columns={'ultima_atualizacao': 'data_pedido'}, inplace=True)
-    pedidos['id'] = range(1, len(pedidos) + 1)  # gera IDs sequenciais para pedidos
-    return pedidos[['id', 'cliente_id', 'data_pedido']]
+    pedidos = pd.DataFrame({
+        'id': np.arange(1, len(carts_df) + 1),  # gera IDs sequenciais para pedidos
+        'cliente_id': carts_df['cliente_id'].to_numpy(),
+        'data_pedido': carts_df['ultima_atualizacao'].to_numpy(),
+    })
+    return apply_schema(pedidos, 'pedidos')
 
 
 def generate_itens_pedido_from_carts(
@@ -56,18 +60,34 @@ def generate_itens_pedido_from_carts(
 
     Returns:
         pd.DataFrame: DataFrame com colunas pedido_id, produto_id, quantidade, preco_unitario.
-        **ATENÇÃO**: Como o preço unitário não está na coleção carts, deve ser incorporado posteriormente ou buscado do catálogo de produtos.
     """
-    registros: List[dict] = []
-
-    for idx, row in carts_df.iterrows():
-        pedido_id = idx + 1  # corresponde ao id gerado no pedido
-        for item in row['itens']:
-            registros.append({
-                'pedido_id': pedido_id,
-                'produto_id': item['produto_id'],
-                'quantidade': item['quantidade'],
-                'preco_unitario': item['preco_unitario']
-            })
-
-    return pd.DataFrame(registros)
+    colunas = ['produto_id', 'quantidade', 'preco_unitario']
+    itens = carts_df['itens']
+
+    # pedido_id corresponde à posição do carrinho, igual ao id gerado em generate_pedidos_from_carts
+    pedido_ids = np.repeat(np.arange(1, len(carts_df) + 1), itens.str.len().to_numpy())
+    registros = pd.DataFrame.from_records(list(chain.from_iterable(itens)), columns=colunas)
+    registros.insert(0, 'pedido_id', pedido_ids)
+
+    return apply_schema(registros, 'itens_pedido')
+
+
+def extract_reviews(reviews_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Gera o DataFrame de avaliações para o modelo relacional a partir da coleção reviews.
+
+    Args:
+        reviews_df (pd.DataFrame): DataFrame com as avaliações do MongoDB.
+
+    Returns:
+        pd.DataFrame: DataFrame com colunas id, produto_id, cliente_id, avaliacao, comentario, data.
+    """
+    avaliacoes = pd.DataFrame({
+        'id': np.arange(1, len(reviews_df) + 1),  # gera IDs sequenciais para avaliações
+        'produto_id': reviews_df['produto_id'].to_numpy(),
+        'cliente_id': reviews_df['cliente_id'].to_numpy(),
+        'avaliacao': reviews_df['avaliacao'].to_numpy(),
+        'comentario': reviews_df['comentario'].to_numpy(),
+        'data': reviews_df['data'].to_numpy(),
+    })
+    return apply_schema(avaliacoes, 'avaliacoes')
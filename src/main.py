@@ -1,31 +1,113 @@
+import time
+
+_START = time.perf_counter()
+
 import os
 import sys
-import time
-from typing import List, Dict
-import pandas as pd
+import argparse
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
 
-from services.data_generator import generate_clients, generate_carts, generate_reviews, generate_products
-from services.mongo_handler import MongoDBClient
-from services.mysql_handler import MySQLClient
-from etl.transform_to_relational import (
-    extract_clients,
-    extract_products,
-    generate_pedidos_from_carts,
-    generate_itens_pedido_from_carts
-)
-from loguru import logger
-from analysis.benchmark import run_benchmark
+
+class _LazyLogger:
+    """
+    Adia o import do loguru até a primeira mensagem de log: importar o módulo ou
+    executar `--help` não paga o custo do import.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        from loguru import logger as _logger
+        return getattr(_logger, name)
+
+
+logger = _LazyLogger()
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    from services.mongo_handler import MongoDBClient
+    from services.mysql_handler import MySQLClient
 
 BENCHMARK_PATH = "data/csv/benchmarks"
 BENCHMARK_FILE = os.path.join(BENCHMARK_PATH, "benchmark_results.csv")
-os.makedirs(BENCHMARK_PATH, exist_ok=True)
 
-mongodb = MongoDBClient()
-mysqldb = MySQLClient()
+# Clientes criados sob demanda: cada etapa inicializa apenas os bancos que utiliza
+_clients: Dict[str, Any] = {}
+
+
+def get_mongodb() -> "MongoDBClient":
+    if "mongodb" not in _clients:
+        from services.mongo_handler import MongoDBClient
+        mongodb = MongoDBClient()
+        mongodb.connect("ecommerce")
+        _clients["mongodb"] = mongodb
+    return _clients["mongodb"]
+
+
+def get_mysqldb() -> "MySQLClient":
+    if "mysqldb" not in _clients:
+        from services.mysql_handler import MySQLClient
+        mysqldb = MySQLClient()
+        mysqldb.connect()
+        _clients["mysqldb"] = mysqldb
+    return _clients["mysqldb"]
+
+
+def dataset_config() -> Tuple[int, Dict[str, int], Dict[str, Any], str]:
+    import json
+    from services.env import load_environment
+    from services.dataset_cache import DEFAULT_SEED, scale_sizes
+    from services.data_generator import DEFAULT_DISTRIBUTION, REFERENCE_DATE
+    load_environment()
+    # DATASET_SCALE multiplica os tamanhos base (mesma escala de dataset_cache.py --scales)
+    sizes = scale_sizes(float(os.getenv("DATASET_SCALE", "1")))
+    # DATASET_DISTRIBUTION (JSON) sobrescreve parcialmente a distribuição padrão,
+    # ex.: {"products": {"kind": "zipf", "exponent": 1.2}, "bursts": {"count": 5, "share": 0.3}}
+    distribution = {**DEFAULT_DISTRIBUTION, **json.loads(os.getenv("DATASET_DISTRIBUTION") or "{}")}
+    reference_date = os.getenv("DATASET_REFERENCE_DATE", REFERENCE_DATE)
+    return int(os.getenv("DATASET_SEED", DEFAULT_SEED)), sizes, distribution, reference_date
+
+
+def mongo_model(ctx: Dict[str, Any]) -> str:
+    """
+    Modelo de documentos do banco principal do MongoDB: --mongo-model, MONGO_MODEL ou 'referenced'.
+    """
+    from services.env import load_environment
+    from etl.mongo_models import MONGO_MODELS
+    load_environment()
+    model = ctx.get("mongo_model") or os.getenv("MONGO_MODEL", "referenced")
+    if model not in MONGO_MODELS:
+        raise ValueError(f"Modelo de documentos desconhecido: '{model}'. Opções: {MONGO_MODELS}")
+    return model
+
+
+def set_benchmark_params(ctx: Dict[str, Any]) -> None:
+    """
+    Registra semente, tamanhos, distribuição, data de referência e modelo de documentos como
+    colunas de todas as linhas de resultado, junto a um identificador único da execução.
+    """
+    import json
+    import uuid
+    from analysis.benchmark import set_run_params
+
+    if "run_id" in ctx:
+        return
+    ctx["run_id"] = uuid.uuid4().hex[:12]
+    seed, sizes, distribution, reference_date = dataset_config()
+    set_run_params(
+        run_id=ctx["run_id"],
+        seed=seed,
+        tamanhos=json.dumps(sizes, sort_keys=True),
+        distribuicao=json.dumps(distribution, sort_keys=True),
+        data_referencia=reference_date,
+        modelo_mongo=mongo_model(ctx),
+    )
+    logger.info(f"Execução '{ctx['run_id']}': parâmetros do dataset registrados nos resultados.")
+
 
 def clear_benchmark_folder() -> None:
+    os.makedirs(BENCHMARK_PATH, exist_ok=True)
     files = os.listdir(BENCHMARK_PATH)
     for f in files:
         file_path = os.path.join(BENCHMARK_PATH, f)
@@ -38,20 +120,16 @@ def append_benchmark_result(query: str, banco: str, tempo: float) -> None:
     Adiciona uma linha de benchmark no arquivo CSV de resultados,
     criando o arquivo se não existir.
     """
-    df_new = pd.DataFrame([{"query": query, "banco": banco, "tempo": tempo}])
-    
-    if not os.path.exists(BENCHMARK_FILE):
-        df_new.to_csv(BENCHMARK_FILE, index=False)
-    else:
-        df_existing = pd.read_csv(BENCHMARK_FILE)
-        df_result = pd.concat([df_existing, df_new], ignore_index=True)
-        df_result.to_csv(BENCHMARK_FILE, index=False)
+    from analysis.benchmark import append_results
+
+    os.makedirs(BENCHMARK_PATH, exist_ok=True)
+    append_results([{"query": query, "banco": banco, "tempo": tempo}], BENCHMARK_FILE)
     logger.info(f"Benchmark salvo: {query}, {banco}, {tempo:.4f}s")
 
 
-def write_and_benchmark_mysql(df: pd.DataFrame, table_name: str) -> None:
+def write_and_benchmark_mysql(df: "pd.DataFrame", table_name: str) -> None:
     start_time = time.perf_counter()
-    mysqldb.df_to_table(df, table_name)
+    get_mysqldb().df_to_table(df, table_name)
     elapsed = time.perf_counter() - start_time
     append_benchmark_result(query=f"write_{table_name}", banco="MySQL", tempo=elapsed)
     logger.success(f"Dados escritos na tabela '{table_name}' em {elapsed:.4f} segundos.")
@@ -59,66 +137,419 @@ def write_and_benchmark_mysql(df: pd.DataFrame, table_name: str) -> None:
 
 def write_and_benchmark_mongo(collection_name: str, data: List[Dict]) -> None:
     start_time = time.perf_counter()
-    mongodb.insert_many(collection_name, data)
+    get_mongodb().insert_many(collection_name, data)
     elapsed = time.perf_counter() - start_time
     append_benchmark_result(query=f"write_{collection_name}", banco="MongoDB", tempo=elapsed)
     logger.success(f"Dados inseridos na coleção '{collection_name}' em {elapsed:.4f} segundos.")
 
 
-def run_pipeline() -> None:
-    logger.info("🚀 Iniciando pipeline de geração e carga de dados...")
+# Etapas da pipeline. O contexto compartilha dados entre etapas executadas no mesmo
+# processo; em execuções isoladas cada etapa recupera suas entradas dos caches em disco.
+
+def stage_generate(ctx: Dict[str, Any]) -> Dict[str, "pa.Table"]:
+    if "dataset" not in ctx:
+        from services.dataset_cache import load_or_build_dataset
+
+        logger.info("Gerando dados de clientes, produtos, avaliações e carrinhos...")
+        seed, sizes, distribution, reference_date = dataset_config()
+        ctx["dataset"] = load_or_build_dataset(
+            seed, sizes, distribution=distribution, reference_date=reference_date
+        )
+        logger.success("✅ Dados gerados com sucesso!")
+    return ctx["dataset"]
+
+
+def cached_dataset(ctx: Dict[str, Any]) -> Optional[Dict[str, "pa.Table"]]:
+    """
+    Recupera o dataset apenas do cache em disco (None se ausente), sem gerá-lo.
+    """
+    if "dataset" not in ctx:
+        from services.dataset_cache import load_cached_dataset
+
+        seed, sizes, distribution, reference_date = dataset_config()
+        dataset = load_cached_dataset(seed, sizes, distribution=distribution, reference_date=reference_date)
+        if dataset is None:
+            return None
+        ctx["dataset"] = dataset
+    return ctx["dataset"]
+
+
+def stage_load_mongo(ctx: Dict[str, Any]) -> None:
+    from etl.mongo_models import dataset_documents
+
+    set_benchmark_params(ctx)
+    model = mongo_model(ctx)
+    logger.info(f"Modelo de documentos do MongoDB: '{model}'.")
+    documents = dataset_documents(model, stage_generate(ctx))
+
+    mongodb = get_mongodb()
+    # O marcador só é regravado pela pipeline após a carga completa
+    mongodb.clear_checkpoint("load-mongo")
+    # Remove as coleções de todos os modelos (ex.: carts não existe em client_embedded)
+    mongodb.drop_collections(["clients", "products", "reviews", "carts"])
+
+    for collection_name, docs in documents.items():
+        write_and_benchmark_mongo(collection_name, docs)
+
 
-    # 1. Geração dos dados
-    logger.info("Gerando dados de clientes, produtos, avaliações e carrinhos...")
-    clients: List[Dict] = generate_clients(5000)
-    client_ids: List[int] = [client["id"] for client in clients]
-    products: List[Dict] = generate_products(100)
-    reviews = generate_reviews(2000, client_ids)
-    carts = generate_carts(1000, client_ids, products)
-    logger.success("✅ Dados gerados com sucesso!")
-
-    # 2. Inserção no MongoDB com benchmark
-    mongodb.connect("ecommerce")
-    mongodb.clear_collections(["clients", "products", "reviews", "carts"])
-
-    write_and_benchmark_mongo("clients", clients)
-    write_and_benchmark_mongo("products", products)
-    write_and_benchmark_mongo("reviews", reviews)
-    write_and_benchmark_mongo("carts", carts)
-
-    # 3. Extração dos dados do MongoDB para DataFrames
-    df_clients = mongodb.to_dataframe("clients")
-    df_products = mongodb.to_dataframe("products")
-    df_reviews = mongodb.to_dataframe("reviews")
-    df_carts = mongodb.to_dataframe("carts")
+def stage_etl(ctx: Dict[str, Any]) -> Dict[str, "pd.DataFrame"]:
+    from services.dataset_cache import save_frames
+    from etl.transform_to_relational import (
+        extract_clients,
+        extract_products,
+        generate_pedidos_from_carts,
+        generate_itens_pedido_from_carts,
+        extract_reviews
+    )
+
+    # Extração dos dados do MongoDB para DataFrames
+    mongodb = get_mongodb()
+    if mongo_model(ctx) == "client_embedded":
+        from etl.mongo_models import CLIENT_EMBEDDED_CARTS_PIPELINE
+        # Sem coleção carts: os carrinhos embutidos são desaninhados a partir de clients
+        df_clients = mongodb.aggregate_to_dataframe("clients", [{"$project": {"carts": 0}}], schema="clients")
+        df_carts = mongodb.aggregate_to_dataframe("clients", CLIENT_EMBEDDED_CARTS_PIPELINE, schema="carts")
+    else:
+        df_clients = mongodb.to_dataframe("clients", schema="clients")
+        df_carts = mongodb.to_dataframe("carts", schema="carts")
+    df_products = mongodb.to_dataframe("products", schema="products")
+    df_reviews = mongodb.to_dataframe("reviews", schema="reviews")
 
     logger.info(f"📦 {len(df_clients)} clientes carregados do MongoDB")
     logger.info(f"📦 {len(df_products)} produtos carregados do MongoDB")
     logger.info(f"📦 {len(df_reviews)} avaliações carregadas do MongoDB")
     logger.info(f"🛒 {len(df_carts)} carrinhos carregados do MongoDB")
 
-    # 4. Transformações para o modelo relacional
-    df_clients_transformed = extract_clients(df_clients)
-    df_products_transformed = extract_products(df_products)
-    df_pedidos = generate_pedidos_from_carts(df_carts)
-    df_itens_pedido = generate_itens_pedido_from_carts(df_carts)
+    # Transformações para o modelo relacional
+    ctx["tables"] = {
+        "clientes": extract_clients(df_clients),
+        "produtos": extract_products(df_products),
+        "pedidos": generate_pedidos_from_carts(df_carts),
+        "itens_pedido": generate_itens_pedido_from_carts(df_carts),
+        "avaliacoes": extract_reviews(df_reviews),
+    }
+    save_frames(ctx["tables"], key=etl_stage_key(ctx))
 
     logger.info("🧪 Transformações concluídas!")
+    return ctx["tables"]
+
+
+def transformed_tables(ctx: Dict[str, Any]) -> Optional[Dict[str, "pd.DataFrame"]]:
+    if "tables" not in ctx:
+        from services.dataset_cache import load_frames
+        # Frames gerados a partir de outro dataset ou de outra versão do ETL não são reaproveitados
+        ctx["tables"] = load_frames(key=etl_stage_key(ctx))
+    return ctx["tables"]
 
-    # 5. Carga no MySQL com benchmark
-    mysqldb.connect()
+
+def stage_load_mysql(ctx: Dict[str, Any]) -> None:
+    tables = transformed_tables(ctx) or stage_etl(ctx)
+    set_benchmark_params(ctx)
+
+    from services.mysql_handler import partition_date_range
+
+    mysqldb = get_mysqldb()
     mysqldb.drop_all_tables()
-    mysqldb.create_all_tables()
+    mysqldb.create_all_tables(date_range=partition_date_range(tables))
+
+    for table_name, df in tables.items():
+        write_and_benchmark_mysql(df, table_name)
+
+
+def stage_bench(ctx: Dict[str, Any]) -> None:
+    """
+    Executa apenas consultas de leitura sobre os dados já carregados: nenhum banco é recarregado.
+    """
+    from analysis.verification import verify_benchmark_results
+    from analysis.benchmark import run_benchmark, RELATIONAL_TABLES
+
+    if ctx.get("clear"):
+        clear_benchmark_folder()
+    set_benchmark_params(ctx)
+
+    tables = transformed_tables(ctx)
+    if tables is None:
+        logger.warning("DataFrames transformados não encontrados em cache; lendo as tabelas do MySQL.")
+        tables = {name: get_mysqldb().read_table(name) for name in RELATIONAL_TABLES}
+
+    run_benchmark(tables, mongo_model(ctx))
+    verify_benchmark_results(tables)
+
+
+# Varreduras que recarregam dados (bancos por modelo/perfil/shard): ficam fora de `bench`
+# e rodam pelos próprios subcomandos ou ao final de `all`.
+
+def sweep_models(ctx: Dict[str, Any], dataset: Dict[str, "pa.Table"], tables: Dict[str, "pd.DataFrame"]) -> None:
+    from analysis.benchmark import run_mongo_models_benchmark
+    run_mongo_models_benchmark(dataset)
+
+
+def sweep_profiles(ctx: Dict[str, Any], dataset: Dict[str, "pa.Table"], tables: Dict[str, "pd.DataFrame"]) -> None:
+    from analysis.benchmark import run_mysql_profiles_benchmark
+    run_mysql_profiles_benchmark(tables)
+    # O baseline foi recarregado com os frames da etapa etl atual
+    mark_mysql_loaded(ctx)
+
+
+def sweep_time_window(ctx: Dict[str, Any], dataset: Dict[str, "pa.Table"], tables: Dict[str, "pd.DataFrame"]) -> None:
+    from analysis.benchmark import run_time_window_benchmark
+    run_time_window_benchmark(dataset, tables)
+
+
+def sweep_sharding(ctx: Dict[str, Any], dataset: Dict[str, "pa.Table"], tables: Dict[str, "pd.DataFrame"]) -> None:
+    from analysis.benchmark import run_sharding_benchmark
+    run_sharding_benchmark(dataset, tables)
+
 
-    write_and_benchmark_mysql(df_clients_transformed, "clientes")
-    write_and_benchmark_mysql(df_products_transformed, "produtos")
-    write_and_benchmark_mysql(df_pedidos, "pedidos")
-    write_and_benchmark_mysql(df_itens_pedido, "itens_pedido")
+SWEEPS: Dict[str, Callable[[Dict[str, Any], Dict[str, "pa.Table"], Dict[str, "pd.DataFrame"]], None]] = {
+    "bench-models": sweep_models,
+    "bench-profiles": sweep_profiles,
+    "bench-time-window": sweep_time_window,
+    "bench-sharding": sweep_sharding,
+}
 
+
+def run_sweeps(ctx: Dict[str, Any], names: Tuple[str, ...]) -> None:
+    from analysis.verification import verify_benchmark_results
+
+    dataset = stage_generate(ctx)
+    tables = transformed_tables(ctx) or stage_etl(ctx)
+    set_benchmark_params(ctx)
+    for name in names:
+        SWEEPS[name](ctx, dataset, tables)
+    verify_benchmark_results(tables)
+
+
+def stage_bench_models(ctx: Dict[str, Any]) -> None:
+    run_sweeps(ctx, ("bench-models",))
+
+
+def stage_bench_profiles(ctx: Dict[str, Any]) -> None:
+    run_sweeps(ctx, ("bench-profiles",))
+
+
+def stage_bench_time_window(ctx: Dict[str, Any]) -> None:
+    run_sweeps(ctx, ("bench-time-window",))
+
+
+def stage_bench_sharding(ctx: Dict[str, Any]) -> None:
+    run_sweeps(ctx, ("bench-sharding",))
+
+
+def stage_bench_writes(ctx: Dict[str, Any]) -> None:
+    from analysis.write_benchmark import run_write_benchmark
+
+    dataset = stage_generate(ctx)
+    tables = transformed_tables(ctx) or stage_etl(ctx)
+    set_benchmark_params(ctx)
+    run_write_benchmark(dataset, tables)
+
+
+def stage_bench_contention(ctx: Dict[str, Any]) -> None:
+    from analysis.contention_workload import run_contention_benchmark
+
+    dataset = stage_generate(ctx)
+    tables = transformed_tables(ctx) or stage_etl(ctx)
+    set_benchmark_params(ctx)
+    run_contention_benchmark(
+        dataset,
+        tables,
+        writer_counts=tuple(ctx["writers"]),
+        readers=ctx["readers"],
+        duration=ctx["duration"],
+    )
+    # O baseline foi recarregado com os frames da etapa etl atual
+    mark_mysql_loaded(ctx)
+
+
+# Checkpoints da pipeline: cada etapa é identificada por um hash das suas entradas
+# (parâmetros do gerador, código das transformações, DDL e destino dos dados) e pulada
+# quando a chave coincide com a da última execução concluída.
+PIPELINE_STAGES = ("generate", "load-mongo", "etl", "load-mysql")
+
+
+def current_dataset_key(ctx: Dict[str, Any]) -> str:
+    if "dataset_key" not in ctx:
+        from services.dataset_cache import dataset_key
+
+        ctx["dataset_key"] = dataset_key(*dataset_config())
+    return ctx["dataset_key"]
+
+
+def etl_stage_key(ctx: Dict[str, Any]) -> str:
+    """
+    Chave da etapa etl (dataset, modelo de documentos e código das transformações), gravada
+    junto aos frames salvos. Não depende de conexão com os bancos.
+    """
+    if "etl_key" not in ctx:
+        from services.checkpoint import source_hash, stage_key
+        from etl import mongo_models, schemas, transform_to_relational
+
+        ctx["etl_key"] = stage_key(
+            "etl", dataset=current_dataset_key(ctx), model=mongo_model(ctx),
+            source=source_hash(transform_to_relational, schemas, mongo_models, stage_etl),
+        )
+    return ctx["etl_key"]
+
+
+def mysql_load_key(ctx: Dict[str, Any]) -> str:
+    """
+    Chave da etapa load-mysql: frames da etapa etl, destino e DDL do schema baseline.
+    """
+    if "mysql_load_key" not in ctx:
+        from services.checkpoint import source_hash, stage_key
+
+        mysqldb = get_mysqldb()
+        ctx["mysql_load_key"] = stage_key(
+            "load-mysql", etl=etl_stage_key(ctx), uri=mysqldb.uri, ddl=mysqldb._schema_ddl("baseline"),
+            source=source_hash(stage_load_mysql),
+        )
+    return ctx["mysql_load_key"]
+
+
+def pipeline_keys(ctx: Dict[str, Any]) -> Dict[str, str]:
+    if "checkpoint_keys" not in ctx:
+        from services.checkpoint import source_hash, stage_key
+        from etl import mongo_models
+
+        dataset, etl = current_dataset_key(ctx), etl_stage_key(ctx)
+        mongodb = get_mongodb()
+        ctx["checkpoint_keys"] = {
+            "generate": stage_key("generate", dataset=dataset),
+            "load-mongo": stage_key(
+                "load-mongo", dataset=dataset, model=mongo_model(ctx), uri=mongodb.uri, db=mongodb.db.name,
+                source=source_hash(mongo_models, stage_load_mongo),
+            ),
+            "etl": etl,
+            "load-mysql": mysql_load_key(ctx),
+        }
+    return ctx["checkpoint_keys"]
+
+
+def mark_mysql_loaded(ctx: Dict[str, Any]) -> None:
+    """
+    Grava no MySQL o marcador da carga das tabelas transformadas atuais (chave da etapa etl
+    do contexto). Usado após recarregar o baseline fora da pipeline (perfis físicos, contenção).
+    """
+    get_mysqldb().write_checkpoint("load-mysql", mysql_load_key(ctx))
+
+
+def mongo_loaded(ctx: Dict[str, Any]) -> bool:
+    """
+    Confirma, pelo marcador gravado no próprio MongoDB, que as coleções vêm da carga atual.
+    """
+    return get_mongodb().read_checkpoint("load-mongo") == pipeline_keys(ctx)["load-mongo"]
+
+
+def mysql_loaded(ctx: Dict[str, Any]) -> bool:
+    """
+    Confirma, pelo marcador gravado no próprio MySQL, que as tabelas vêm da carga atual.
+    """
+    return get_mysqldb().read_checkpoint("load-mysql") == pipeline_keys(ctx)["load-mysql"]
+
+
+def load_mongo_marked(ctx: Dict[str, Any]) -> None:
+    stage_load_mongo(ctx)
+    get_mongodb().write_checkpoint("load-mongo", pipeline_keys(ctx)["load-mongo"])
+
+
+def load_mysql_marked(ctx: Dict[str, Any]) -> None:
+    stage_load_mysql(ctx)
+    mark_mysql_loaded(ctx)
+
+
+def run_pipeline(ctx: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, "pa.Table"], Dict[str, "pd.DataFrame"]]:
+    from services.checkpoint import run_checkpointed
+
+    ctx = ctx if ctx is not None else {}
+    force = ctx.get("force", False)
+    keys = pipeline_keys(ctx)
+    logger.info("🚀 Iniciando pipeline de geração e carga de dados...")
+    run_checkpointed(
+        "generate", keys["generate"], lambda: stage_generate(ctx), restore=lambda: cached_dataset(ctx), force=force
+    )
+    run_checkpointed(
+        "load-mongo", keys["load-mongo"], lambda: load_mongo_marked(ctx), validate=lambda: mongo_loaded(ctx), force=force
+    )
+    run_checkpointed(
+        "etl", keys["etl"], lambda: stage_etl(ctx), restore=lambda: transformed_tables(ctx), force=force
+    )
+    run_checkpointed(
+        "load-mysql", keys["load-mysql"], lambda: load_mysql_marked(ctx), validate=lambda: mysql_loaded(ctx), force=force
+    )
     logger.success("🎉 Pipeline finalizada com sucesso!")
+    return ctx["dataset"], ctx["tables"]
 
 
-if __name__ == "__main__":
+def stage_all(ctx: Dict[str, Any]) -> None:
+    from analysis.benchmark import run_benchmark
+
     clear_benchmark_folder()
-    run_pipeline()
-    run_benchmark()
+    _, tables = run_pipeline(ctx)
+    set_benchmark_params(ctx)
+    run_benchmark(tables, mongo_model(ctx))
+    # As varreduras verificam, ao final, todos os resultados da execução
+    run_sweeps(ctx, tuple(SWEEPS))
+
+
+STAGES: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], str]] = {
+    "generate": (stage_generate, "Gera (ou lê do cache) o dataset sintético."),
+    "load-mongo": (stage_load_mongo, "Carrega o dataset no MongoDB."),
+    "etl": (stage_etl, "Extrai do MongoDB e transforma para o modelo relacional."),
+    "load-mysql": (stage_load_mysql, "Carrega as tabelas transformadas no MySQL."),
+    "bench": (stage_bench, "Executa apenas os benchmarks sobre os dados já carregados."),
+    "bench-models": (stage_bench_models, "Recarrega o dataset em cada modelo de documentos do MongoDB e mede as consultas."),
+    "bench-profiles": (stage_bench_profiles, "Recarrega o MySQL em cada perfil físico e mede as consultas (restaura o baseline)."),
+    "bench-time-window": (stage_bench_time_window, "Compara as janelas de tempo no MongoDB sem índice, com índice e com buckets."),
+    "bench-sharding": (stage_bench_sharding, "Mede as consultas em scatter-gather de 1 a N shards."),
+    "bench-writes": (stage_bench_writes, "Executa a matriz de benchmarks de escrita (lote, ordenação, write concern, transação)."),
+    "bench-contention": (stage_bench_contention, "Executa o workload concorrente de leitura/escrita sobre carrinhos."),
+    "all": (stage_all, "Executa a pipeline (pulando etapas inalteradas), os benchmarks e as varreduras (padrão)."),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from etl.mongo_models import MONGO_MODELS
+
+    parser = argparse.ArgumentParser(description="Pipeline de comparação MySQL x MongoDB.")
+    subparsers = parser.add_subparsers(dest="stage")
+    for name, (_, help_text) in STAGES.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == "bench":
+            subparser.add_argument(
+                "--clear", action="store_true", help="Limpa a pasta de benchmarks antes de executar."
+            )
+        if name == "all":
+            subparser.add_argument(
+                "--force", action="store_true", help="Ignora os checkpoints e executa todas as etapas."
+            )
+        if name != "generate":
+            subparser.add_argument(
+                "--mongo-model", choices=MONGO_MODELS, default=None,
+                help="Modelo de documentos do MongoDB principal (padrão: MONGO_MODEL ou 'referenced').",
+            )
+        if name == "bench-contention":
+            subparser.add_argument("--duration", type=float, default=20.0, help="Duração de cada cenário (s).")
+            subparser.add_argument("--readers", type=int, default=4, help="Quantidade fixa de leitores.")
+            subparser.add_argument(
+                "--writers", type=int, nargs="+", default=[0, 1, 4, 16],
+                help="Quantidades de escritores por cenário (o cenário sem escritores é sempre executado).",
+            )
+    args = parser.parse_args(argv)
+    stage = args.stage or "all"
+
+    logger.info(f"⏱️ Inicialização concluída em {(time.perf_counter() - _START) * 1000:.1f} ms (etapa '{stage}').")
+
+    if stage in PIPELINE_STAGES[1:]:
+        # Etapas executadas isoladamente alteram o estado dos bancos/frames fora da pipeline
+        from services.checkpoint import invalidate_checkpoint
+        invalidate_checkpoint(stage)
+
+    start = time.perf_counter()
+    ctx = {key: value for key, value in vars(args).items() if key != "stage"}
+    STAGES[stage][0](ctx)
+    logger.success(f"Etapa '{stage}' concluída em {time.perf_counter() - start:.4f} segundos.")
+
+
+if __name__ == "__main__":
+    main()
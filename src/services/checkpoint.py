@@ -0,0 +1,109 @@
+import os
+import json
+import time
+import hashlib
+import inspect
+from typing import Any, Callable, Optional
+from loguru import logger
+
+CHECKPOINT_DIR = "data/cache/checkpoints"
+
+
+def source_hash(*objects: Any) -> str:
+    """
+    Gera um hash do código-fonte de módulos/funções/classes, usado para invalidar
+    checkpoints e caches quando a implementação de uma etapa muda.
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        digest.update(inspect.getsource(obj).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def stage_key(stage: str, **inputs: Any) -> str:
+    """
+    Gera a chave de uma etapa a partir das suas entradas e configurações (serializáveis em JSON).
+    """
+    payload = json.dumps({"stage": stage, **inputs}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _marker_path(stage: str, checkpoint_dir: str) -> str:
+    return os.path.join(checkpoint_dir, f"{stage}.json")
+
+
+def read_checkpoint(stage: str, checkpoint_dir: str = CHECKPOINT_DIR) -> Optional[dict]:
+    """
+    Lê o marcador da última execução concluída da etapa (chave, tempo e data) ou None.
+    """
+    path = _marker_path(stage, checkpoint_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_checkpoint(stage: str, key: str, tempo: float, checkpoint_dir: str = CHECKPOINT_DIR) -> None:
+    """
+    Registra a conclusão da etapa com a chave das entradas e o tempo de execução.
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    with open(_marker_path(stage, checkpoint_dir), "w", encoding="utf-8") as f:
+        json.dump({"stage": stage, "key": key, "tempo": tempo, "concluido_em": time.time()}, f)
+
+
+def invalidate_checkpoint(stage: str, checkpoint_dir: str = CHECKPOINT_DIR) -> None:
+    """
+    Remove o marcador da etapa, forçando sua execução na próxima pipeline.
+    """
+    path = _marker_path(stage, checkpoint_dir)
+    if os.path.exists(path):
+        os.remove(path)
+        logger.debug(f"Checkpoint da etapa '{stage}' invalidado.")
+
+
+def run_checkpointed(
+    stage: str,
+    key: str,
+    run: Callable[[], Any],
+    restore: Optional[Callable[[], Any]] = None,
+    validate: Optional[Callable[[], bool]] = None,
+    force: bool = False,
+    checkpoint_dir: str = CHECKPOINT_DIR,
+) -> Any:
+    """
+    Executa a etapa apenas se a chave mudou desde a última execução concluída.
+
+    Quando a chave coincide, a etapa é pulada: `validate` confirma que o estado persistido
+    (ex.: dados carregados no banco) ainda existe e `restore` recupera as saídas salvas.
+    Se a validação falhar ou `restore` retornar None, a etapa é executada normalmente.
+
+    Args:
+        stage (str): Nome da etapa.
+        key (str): Chave das entradas (ver stage_key).
+        run (Callable[[], Any]): Executa a etapa.
+        restore (Optional[Callable[[], Any]]): Recupera as saídas persistidas da etapa.
+        validate (Optional[Callable[[], bool]]): Verifica se o estado persistido ainda é válido.
+        force (bool): Ignora o checkpoint e executa a etapa.
+        checkpoint_dir (str): Diretório dos marcadores.
+
+    Returns:
+        Any: Resultado de `run` ou de `restore`.
+    """
+    marker = read_checkpoint(stage, checkpoint_dir)
+    if not force and marker is not None and marker["key"] == key:
+        start = time.perf_counter()
+        if validate is None or validate():
+            result = restore() if restore is not None else None
+            if restore is None or result is not None:
+                economia = max(marker["tempo"] - (time.perf_counter() - start), 0.0)
+                logger.success(f"⏭️ Etapa '{stage}' inalterada (chave {key}): pulada, {economia:.2f}s economizados.")
+                return result
+        logger.warning(f"Saídas da etapa '{stage}' ausentes ou inválidas; executando novamente.")
+
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    save_checkpoint(stage, key, elapsed, checkpoint_dir)
+    logger.info(f"Etapa '{stage}' executada em {elapsed:.4f} segundos (chave {key}).")
+    return result
@@ -1,32 +1,151 @@
-from faker import Faker
-from random import randint, uniform, sample
-from typing import List, Tuple
+from datetime import datetime, timedelta
+from functools import lru_cache
+from random import uniform, getrandbits
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from loguru import logger
+import numpy as np
 import json
 import os
 import uuid
 
-fake = Faker("pt_BR")
-
 NUM_REVIEWS = 20_000
 NUM_CARTS = 100_000
 NUM_PRODUCTS = 100
 NUM_CLIENTS = 5_000
 
-def generate_clients(n: int) -> List[dict]:
+# Data de referência (fim do período gerado). Todas as datas são geradas relativas a ela,
+# e não ao relógio, para que o dataset seja reprodutível a partir da semente.
+REFERENCE_DATE = "2025-06-30"
+
+# Distribuições de seleção de chaves e de tempo usadas pelos geradores:
+#   clients/products: {"kind": "uniform"}
+#                     {"kind": "zipf", "exponent": 1.1}                     -> P(rank k) ∝ 1 / k^exponent
+#                     {"kind": "hotset", "hot_fraction": 0.1, "hot_share": 0.8}
+#                     -> 10% das chaves recebem 80% das escolhas
+#                     "shuffle" (padrão True) espalha as chaves quentes pelos ids com uma permutação
+#                     fixa (as mesmas chaves são quentes em avaliações e carrinhos); False mantém
+#                     as chaves quentes nos menores ids (localidade no índice).
+#   bursts:           {"count": 5, "share": 0.3, "width_hours": 6}
+#                     -> 30% de ultima_atualizacao concentrados em 5 rajadas com desvio de 6h
+DEFAULT_DISTRIBUTION: Dict[str, Any] = {
+    "clients": {"kind": "uniform"},
+    "products": {"kind": "uniform"},
+    "bursts": None,
+}
+
+_rng = np.random.default_rng()
+
+@lru_cache(maxsize=None)
+def get_faker():
+    """
+    Cria o Faker pt_BR sob demanda (importar e instanciar o Faker é caro e
+    desnecessário quando o dataset vem do cache).
+    """
+    from faker import Faker
+    return Faker("pt_BR")
+
+def seed_generators(seed: int) -> None:
+    """
+    Fixa a semente do Faker, do módulo random e do gerador do NumPy para gerar datasets reprodutíveis.
+    """
+    global _rng
+    get_faker().seed_instance(seed)
+    random.seed(seed)
+    _rng = np.random.default_rng(seed)
+
+def key_weights(n: int, spec: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    Calcula a probabilidade de escolha de cada uma das n chaves conforme a distribuição.
+
+    Args:
+        n (int): Quantidade de chaves.
+        spec (Optional[Dict[str, Any]]): Distribuição ({"kind": "uniform" | "zipf" | "hotset", ...}).
+
+    Returns:
+        np.ndarray: Probabilidades (somam 1) na ordem das chaves.
+
+    Raises:
+        ValueError: Se o tipo de distribuição não for suportado.
+    """
+    spec = spec or {"kind": "uniform"}
+    kind = spec.get("kind", "uniform")
+    if kind == "uniform":
+        weights = np.ones(n)
+    elif kind == "zipf":
+        weights = 1.0 / np.arange(1, n + 1) ** spec.get("exponent", 1.1)
+    elif kind == "hotset":
+        hot = max(1, int(np.ceil(n * spec.get("hot_fraction", 0.1))))
+        hot_share = spec.get("hot_share", 0.8) if hot < n else 1.0
+        weights = np.full(n, (1.0 - hot_share) / max(n - hot, 1))
+        weights[:hot] = hot_share / hot
+    else:
+        raise ValueError(f"Distribuição desconhecida: '{kind}'. Opções: uniform, zipf, hotset")
+
+    if spec.get("shuffle", True):
+        weights = np.random.default_rng(n).permutation(weights)
+    return weights / weights.sum()
+
+def sample_keys(keys: Sequence[int], size: int, spec: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    Sorteia `size` chaves (com reposição) de forma vetorizada conforme a distribuição.
+    """
+    return _rng.choice(np.asarray(keys), size=size, p=key_weights(len(keys), spec))
+
+def sample_distinct_keys(
+    keys: Sequence[int], counts: np.ndarray, spec: Optional[Dict[str, Any]] = None, chunk_size: int = 10_000
+) -> List[np.ndarray]:
+    """
+    Sorteia, para cada linha, counts[i] chaves distintas (sem reposição) ponderadas pela
+    distribuição, usando o truque Gumbel-top-k de forma vetorizada.
+    """
+    keys = np.asarray(keys)
+    log_weights = np.log(key_weights(len(keys), spec))
+    selected = []
+    # Processa em blocos para limitar a matriz de scores (linhas x chaves) em memória
+    for start in range(0, len(counts), chunk_size):
+        chunk = counts[start:start + chunk_size]
+        scores = log_weights + _rng.gumbel(size=(len(chunk), len(keys)))
+        top = np.argsort(-scores, axis=1)[:, :int(chunk.max())]
+        selected += [keys[row[:count]] for row, count in zip(top, chunk)]
+    return selected
+
+def sample_timestamps(
+    size: int, days: int = 365, bursts: Optional[Dict[str, Any]] = None, reference_date: str = REFERENCE_DATE
+) -> List[str]:
+    """
+    Gera timestamps ISO-8601 nos `days` dias anteriores à data de referência: uniformes ou
+    com parte concentrada em rajadas (bursts) de atividade.
+    """
+    end = datetime.fromisoformat(reference_date)
+    span = days * 86_400
+    offsets = _rng.uniform(0, span, size)
+    if bursts:
+        centers = _rng.uniform(0, span, bursts.get("count", 5))
+        in_burst = _rng.random(size) < bursts.get("share", 0.3)
+        chosen = _rng.choice(centers, size=int(in_burst.sum()))
+        offsets[in_burst] = chosen + _rng.normal(0, bursts.get("width_hours", 6) * 3600, len(chosen))
+        offsets = np.clip(offsets, 0, span)
+    start = np.datetime64(end - timedelta(days=days), "s")
+    return np.datetime_as_string(start + offsets.astype("timedelta64[s]"), unit="s").tolist()
+
+def generate_clients(n: int, reference_date: str = REFERENCE_DATE) -> List[dict]:
     logger.info(f"Gerando {n} clientes...")
+    fake = get_faker()
+    end = datetime.fromisoformat(reference_date).date()
     return [
         {
             "id": i,
             "nome": fake.name(),
             "email": fake.email(),
-            "data_cadastro": fake.date_between(start_date="-2y", end_date="today").isoformat(),
+            "data_cadastro": fake.date_between(start_date=end - timedelta(days=730), end_date=end).isoformat(),
         }
         for i in range(1, n + 1)
     ]
 
 def generate_products(n: int) -> List[dict]:
     logger.info(f"Gerando {n} produtos...")
+    fake = get_faker()
     return [
         {
             "id": i,
@@ -36,41 +155,64 @@ def generate_products(n: int) -> List[dict]:
         for i in range(1, n + 1)
     ]
 
-def generate_reviews(n: int, client_ids: List[int]) -> List[dict]:
+def generate_reviews(
+    n: int,
+    client_ids: List[int],
+    distribution: Optional[Dict[str, Any]] = None,
+    product_ids: Optional[List[int]] = None,
+    reference_date: str = REFERENCE_DATE,
+) -> List[dict]:
     logger.info(f"Gerando {n} avaliações de produtos...")
+    fake = get_faker()
+    end = datetime.fromisoformat(reference_date)
+    distribution = distribution or DEFAULT_DISTRIBUTION
+    produtos = sample_keys(product_ids or range(1, NUM_PRODUCTS + 1), n, distribution.get("products")).tolist()
+    clientes = sample_keys(client_ids, n, distribution.get("clients")).tolist()
     return [
         {
-            "produto_id": randint(1, NUM_PRODUCTS),
-            "cliente_id": fake.random_element(elements=client_ids),
+            "produto_id": produto_id,
+            "cliente_id": cliente_id,
             "avaliacao": round(uniform(1.0, 5.0), 1),
             "comentario": fake.sentence(nb_words=6),
-            "data": fake.date_time_between(start_date="-1y", end_date="now").isoformat()
+            "data": fake.date_time_between(start_date=end - timedelta(days=365), end_date=end).isoformat()
         }
-        for _ in range(n)
+        for produto_id, cliente_id in zip(produtos, clientes)
     ]
 
-def generate_carts(n: int, client_ids: List[int], products: List[dict]) -> List[dict]:
+def generate_carts(
+    n: int,
+    client_ids: List[int],
+    products: List[dict],
+    distribution: Optional[Dict[str, Any]] = None,
+    reference_date: str = REFERENCE_DATE,
+) -> List[dict]:
     logger.info(f"Gerando {n} carrinhos de compras...")
+    distribution = distribution or DEFAULT_DISTRIBUTION
     product_price_map = {p["id"]: p["preco"] for p in products}
+
+    num_items = _rng.integers(1, 6, size=n)
+    produtos_por_carrinho = sample_distinct_keys(list(product_price_map), num_items, distribution.get("products"))
+    quantidades = _rng.integers(1, 4, size=int(num_items.sum())).tolist()
+    clientes = sample_keys(client_ids, n, distribution.get("clients")).tolist()
+    datas = sample_timestamps(n, bursts=distribution.get("bursts"), reference_date=reference_date)
+
     carts = []
-    for _ in range(n):
-        num_items = randint(1, 5)
-        produtos_ids = sample(range(1, NUM_PRODUCTS + 1), num_items)
+    posicao = 0
+    for produtos_ids, cliente_id, data in zip(produtos_por_carrinho, clientes, datas):
         itens = []
-        for pid in produtos_ids:
-            quantidade = randint(1, 3)
-            preco_unitario = product_price_map[pid]
+        for pid in produtos_ids.tolist():
             itens.append({
                 "produto_id": pid,
-                "quantidade": quantidade,
-                "preco_unitario": preco_unitario
+                "quantidade": quantidades[posicao],
+                "preco_unitario": product_price_map[pid]
             })
+            posicao += 1
         cart = {
-            # Usando UUID para garantir id único do pedido
-            "pedido_id": str(uuid.uuid4()),
-            "cliente_id": fake.random_element(elements=client_ids),
+            # Usando UUID (derivado do random semeado) para garantir id único do pedido
+            "pedido_id": str(uuid.UUID(int=getrandbits(128), version=4)),
+            "cliente_id": cliente_id,
             "itens": itens,
-            "ultima_atualizacao": fake.date_time_between(start_date="-1y", end_date="now").isoformat()
+            "ultima_atualizacao": data
         }
         carts.append(cart)
     return carts
@@ -0,0 +1,291 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+import pyarrow as pa
+from loguru import logger
+from services import data_generator
+from services.checkpoint import source_hash
+from services.data_generator import (
+    DEFAULT_DISTRIBUTION,
+    REFERENCE_DATE,
+    seed_generators,
+    generate_clients,
+    generate_products,
+    generate_reviews,
+    generate_carts,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+CACHE_DIR = "data/cache/datasets"
+FRAMES_DIR = "data/cache/frames"
+CACHE_VERSION = 2
+DATASETS = ("clients", "products", "reviews", "carts")
+
+DEFAULT_SEED = 42
+BASE_SIZES: Dict[str, int] = {"clients": 5000, "products": 100, "reviews": 2000, "carts": 1000}
+
+
+def scale_sizes(scale: float) -> Dict[str, int]:
+    """
+    Multiplica os tamanhos base de clientes, avaliações e carrinhos pela escala informada.
+    O catálogo de produtos é mantido fixo (NUM_PRODUCTS no gerador).
+    """
+    return {
+        name: size if name == "products" else max(1, int(size * scale))
+        for name, size in BASE_SIZES.items()
+    }
+
+
+def dataset_key(
+    seed: int,
+    sizes: Dict[str, int],
+    distribution: Optional[Dict[str, Any]] = None,
+    reference_date: str = REFERENCE_DATE,
+) -> str:
+    """
+    Gera a chave do dataset a partir da semente, dos tamanhos, da distribuição de chaves,
+    da data de referência e do código-fonte do gerador.
+    """
+    payload = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "seed": seed,
+            "sizes": sizes,
+            "distribution": distribution or DEFAULT_DISTRIBUTION,
+            "reference_date": reference_date,
+            "generator": source_hash(data_generator),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def dataset_dir(
+    seed: int,
+    sizes: Dict[str, int],
+    cache_dir: str = CACHE_DIR,
+    distribution: Optional[Dict[str, Any]] = None,
+    reference_date: str = REFERENCE_DATE,
+) -> str:
+    return os.path.join(cache_dir, f"seed{seed}_{dataset_key(seed, sizes, distribution, reference_date)}")
+
+
+def build_dataset(
+    seed: int,
+    sizes: Dict[str, int],
+    distribution: Optional[Dict[str, Any]] = None,
+    reference_date: str = REFERENCE_DATE,
+) -> Dict[str, List[dict]]:
+    """
+    Gera clientes, produtos, avaliações e carrinhos de forma determinística.
+
+    Args:
+        seed (int): Semente usada pelo Faker, pelo módulo random e pelo NumPy.
+        sizes (Dict[str, int]): Quantidade de registros por dataset.
+        distribution (Optional[Dict[str, Any]]): Distribuição de clientes, produtos e rajadas
+            temporais (ver DEFAULT_DISTRIBUTION em data_generator).
+        reference_date (str): Data ISO-8601 que encerra o período das datas geradas.
+
+    Returns:
+        Dict[str, List[dict]]: Registros gerados por nome de dataset.
+    """
+    seed_generators(seed)
+    clients = generate_clients(sizes["clients"], reference_date)
+    client_ids = [client["id"] for client in clients]
+    products = generate_products(sizes["products"])
+    product_ids = [product["id"] for product in products]
+    reviews = generate_reviews(sizes["reviews"], client_ids, distribution, product_ids, reference_date)
+    carts = generate_carts(sizes["carts"], client_ids, products, distribution, reference_date)
+    return {"clients": clients, "products": products, "reviews": reviews, "carts": carts}
+
+
+def save_dataset(dataset: Dict[str, List[dict]], path: str, manifest: Dict) -> None:
+    """
+    Salva cada dataset em um arquivo Arrow IPC sem compressão (mapeável em memória).
+
+    Args:
+        dataset (Dict[str, List[dict]]): Registros por nome de dataset.
+        path (str): Diretório de destino.
+        manifest (Dict): Metadados gravados em manifest.json.
+    """
+    os.makedirs(path, exist_ok=True)
+    for name in DATASETS:
+        table = pa.Table.from_pylist(dataset[name])
+        with pa.OSFile(os.path.join(path, f"{name}.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    with open(os.path.join(path, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    logger.success(f"Dataset salvo em cache: {path}")
+
+
+def load_dataset(path: str) -> Dict[str, pa.Table]:
+    """
+    Carrega os datasets de um diretório de cache via memory-map (leitura zero-copy).
+
+    Args:
+        path (str): Diretório do dataset.
+
+    Returns:
+        Dict[str, pa.Table]: Tabelas Arrow por nome de dataset.
+    """
+    tables = {}
+    for name in DATASETS:
+        source = pa.memory_map(os.path.join(path, f"{name}.arrow"), "r")
+        tables[name] = pa.ipc.open_file(source).read_all()
+    return tables
+
+
+def load_cached_dataset(
+    seed: int = DEFAULT_SEED,
+    sizes: Optional[Dict[str, int]] = None,
+    cache_dir: str = CACHE_DIR,
+    distribution: Optional[Dict[str, Any]] = None,
+    reference_date: str = REFERENCE_DATE,
+) -> Optional[Dict[str, pa.Table]]:
+    """
+    Lê do cache o dataset para os parâmetros informados, sem gerá-lo.
+
+    Returns:
+        Optional[Dict[str, pa.Table]]: Tabelas Arrow (memory-mapped) ou None se o dataset não estiver em cache.
+    """
+    sizes = sizes or BASE_SIZES
+    distribution = {**DEFAULT_DISTRIBUTION, **(distribution or {})}
+    path = dataset_dir(seed, sizes, cache_dir, distribution, reference_date)
+    if not os.path.exists(os.path.join(path, "manifest.json")):
+        return None
+    return load_dataset(path)
+
+
+def load_or_build_dataset(
+    seed: int = DEFAULT_SEED,
+    sizes: Optional[Dict[str, int]] = None,
+    cache_dir: str = CACHE_DIR,
+    distribution: Optional[Dict[str, Any]] = None,
+    reference_date: str = REFERENCE_DATE,
+) -> Dict[str, pa.Table]:
+    """
+    Retorna o dataset para a semente, os tamanhos, a distribuição e a data de referência informados, lendo do cache
+    quando disponível ou gerando e salvando no cache caso contrário.
+
+    Args:
+        seed (int): Semente do gerador.
+        sizes (Optional[Dict[str, int]]): Tamanhos dos datasets. Se None, usa BASE_SIZES.
+        cache_dir (str): Diretório raiz do cache.
+        distribution (Optional[Dict[str, Any]]): Distribuição de chaves (mesclada sobre DEFAULT_DISTRIBUTION).
+        reference_date (str): Data ISO-8601 que encerra o período das datas geradas.
+
+    Returns:
+        Dict[str, pa.Table]: Tabelas Arrow (memory-mapped) por nome de dataset. A conversão para
+            dicionários fica a cargo de quem insere os documentos (ver mongo_models.dataset_documents).
+    """
+    sizes = sizes or BASE_SIZES
+    distribution = {**DEFAULT_DISTRIBUTION, **(distribution or {})}
+    path = dataset_dir(seed, sizes, cache_dir, distribution, reference_date)
+
+    start = time.perf_counter()
+    if os.path.exists(os.path.join(path, "manifest.json")):
+        tables = load_dataset(path)
+        logger.success(f"Dataset carregado do cache {path} em {time.perf_counter() - start:.4f} segundos.")
+        return tables
+
+    logger.info(f"Dataset não encontrado em cache ({path}). Gerando...")
+    dataset = build_dataset(seed, sizes, distribution, reference_date)
+    elapsed = time.perf_counter() - start
+    save_dataset(dataset, path, {
+        "seed": seed,
+        "sizes": sizes,
+        "distribution": distribution,
+        "reference_date": reference_date,
+        "version": CACHE_VERSION,
+        "tempo_geracao": elapsed,
+    })
+    logger.success(f"Dataset gerado em {elapsed:.4f} segundos.")
+    return load_dataset(path)
+
+
+def save_frames(frames: Dict[str, "pd.DataFrame"], path: str = FRAMES_DIR, key: Optional[str] = None) -> None:
+    """
+    Salva DataFrames transformados em arquivos Arrow IPC (Feather v2 sem compressão),
+    preservando os tipos compactos (categóricos, strings Arrow, inteiros sem sinal).
+
+    Args:
+        frames (Dict[str, pd.DataFrame]): DataFrames por nome de tabela.
+        path (str): Diretório de destino.
+        key (Optional[str]): Chave das entradas que produziram os DataFrames (ex.: chave da etapa etl).
+    """
+    os.makedirs(path, exist_ok=True)
+    for name, df in frames.items():
+        df.reset_index(drop=True).to_feather(os.path.join(path, f"{name}.arrow"), compression="uncompressed")
+    with open(os.path.join(path, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump({"tables": list(frames), "key": key}, f)
+    logger.success(f"DataFrames transformados salvos em: {path}")
+
+
+def load_frames(path: str = FRAMES_DIR, key: Optional[str] = None) -> Optional[Dict[str, "pd.DataFrame"]]:
+    """
+    Carrega DataFrames salvos por save_frames via memory-map, na ordem em que foram salvos.
+
+    Args:
+        path (str): Diretório dos DataFrames.
+        key (Optional[str]): Chave esperada; se informada e diferente da gravada no manifesto,
+            os DataFrames são considerados desatualizados.
+
+    Returns:
+        Optional[Dict[str, pd.DataFrame]]: DataFrames por nome de tabela ou None se não houver
+            cache ou se ele tiver sido gerado a partir de outras entradas.
+    """
+    manifest_path = os.path.join(path, "manifest.json")
+    if not os.path.exists(manifest_path):
+        return None
+    from pyarrow import feather
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if key is not None and manifest.get("key") != key:
+        logger.warning(f"DataFrames em {path} gerados com outra chave ({manifest.get('key')} != {key}); ignorando.")
+        return None
+    return {
+        name: feather.read_table(os.path.join(path, f"{name}.arrow"), memory_map=True).to_pandas()
+        for name in manifest["tables"]
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Pré-gera datasets em cache para diferentes escalas.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Semente do gerador.")
+    parser.add_argument(
+        "--scales", type=float, nargs="+", default=[1.0],
+        help="Escalas aplicadas aos tamanhos base (ex.: 1 10 100).",
+    )
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Diretório raiz do cache.")
+    parser.add_argument(
+        "--distribution", type=json.loads, default=None,
+        help='Distribuição em JSON (ex.: \'{"products": {"kind": "zipf", "exponent": 1.2}}\').',
+    )
+    parser.add_argument(
+        "--reference-date", default=REFERENCE_DATE, help="Data (YYYY-MM-DD) que encerra o período das datas geradas."
+    )
+    args = parser.parse_args(argv)
+    distribution = {**DEFAULT_DISTRIBUTION, **(args.distribution or {})}
+
+    for scale in args.scales:
+        sizes = scale_sizes(scale)
+        path = dataset_dir(args.seed, sizes, args.cache_dir, distribution, args.reference_date)
+        if os.path.exists(os.path.join(path, "manifest.json")):
+            logger.info(f"Dataset escala {scale} já existe em {path}.")
+            continue
+        logger.info(f"Preparando dataset escala {scale} ({sizes})...")
+        load_or_build_dataset(args.seed, sizes, args.cache_dir, distribution, args.reference_date)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import re
+from typing import Dict
+import duckdb
+import pandas as pd
+from loguru import logger
+
+
+class DuckDBClient:
+    """
+    Classe para executar as consultas analíticas em um DuckDB embarcado (em processo,
+    sem servidor), sobre os mesmos DataFrames carregados no MySQL.
+    """
+
+    def __init__(self, database: str = ":memory:") -> None:
+        """
+        Inicializa a conexão com o DuckDB.
+
+        Args:
+            database (str): Caminho do arquivo do banco. Default é ':memory:'.
+        """
+        self.conn = duckdb.connect(database)
+        logger.debug(f"Conexão DuckDB criada: {database}")
+
+    def register_tables(self, tables: Dict[str, pd.DataFrame]) -> None:
+        """
+        Registra DataFrames como tabelas virtuais. O DuckDB lê os arrays do pandas/Arrow
+        diretamente (zero-copy), sem carga ou conversão prévia.
+
+        Args:
+            tables (Dict[str, pd.DataFrame]): DataFrames por nome de tabela.
+        """
+        for table_name, df in tables.items():
+            self.conn.register(table_name, df)
+            logger.info(f"Tabela '{table_name}' registrada no DuckDB com {len(df)} registros.")
+
+    @staticmethod
+    def adapt_sql(query: str) -> str:
+        """
+        Adapta o dialeto MySQL para o DuckDB: identificadores com crase passam a usar aspas duplas.
+        As consultas de comparison_queries.py usam SQL padrão e passam sem alteração.
+        """
+        return re.sub(r"`([^`]*)`", r'"\1"', query)
+
+    def query(self, query: str) -> pd.DataFrame:
+        """
+        Executa uma consulta SQL e retorna o resultado como DataFrame.
+
+        Args:
+            query (str): Consulta SQL (dialeto MySQL).
+
+        Returns:
+            pd.DataFrame: Resultado da consulta.
+
+        Raises:
+            duckdb.Error: Em caso de erro na consulta.
+        """
+        try:
+            return self.conn.execute(self.adapt_sql(query)).df()
+        except duckdb.Error as e:
+            logger.error(f"Erro ao executar consulta no DuckDB: {e}")
+            raise
+
+    def close(self) -> None:
+        self.conn.close()
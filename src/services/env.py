@@ -0,0 +1,10 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def load_environment() -> None:
+    """
+    Carrega as variáveis do arquivo .env uma única vez por processo.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
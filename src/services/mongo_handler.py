@@ -1,12 +1,19 @@
 import os
+import sys
+from datetime import datetime
 from typing import Optional, List, Dict, Any
 import pandas as pd
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, PyMongoError
 from loguru import logger
-from dotenv import load_dotenv
 
-load_dotenv()
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+from services.env import load_environment
+
+# Coleção de controle com a chave da última carga concluída (checkpoints da pipeline)
+CHECKPOINT_COLLECTION = "_checkpoint"
+
 
 class MongoDBClient:
     """
@@ -21,6 +28,7 @@ class MongoDBClient:
         Args:
             uri (Optional[str]): URI do MongoDB. Se None, busca no ambiente.
         """
+        load_environment()
         self.uri = uri or self._get_mongo_uri()
         self.client: Optional[MongoClient] = None
         self.db = None
@@ -116,14 +124,96 @@ class MongoDBClient:
                 logger.error(f"Erro ao limpar a coleção '{name}': {e}")
                 raise
 
+    def drop_collections(self, collections: List[str]) -> None:
+        """
+        Remove as coleções especificadas (documentos, índices e armazenamento).
+
+        Args:
+            collections (List[str]): Lista com os nomes das coleções a serem removidas.
+
+        Raises:
+            PyMongoError: Em caso de falha na remoção.
+        """
+        for name in collections:
+            try:
+                self.db.drop_collection(name)
+                logger.warning(f"Coleção '{name}' removida.")
+            except PyMongoError as e:
+                logger.error(f"Erro ao remover a coleção '{name}': {e}")
+                raise
+
+    def collection_stats(self, collection_name: str) -> Dict[str, Any]:
+        """
+        Retorna estatísticas de armazenamento de uma coleção (comando collStats).
+
+        Args:
+            collection_name (str): Nome da coleção.
+
+        Returns:
+            Dict[str, Any]: Quantidade de documentos, tamanho dos dados (size),
+            tamanho em disco (storageSize) e tamanho dos índices (totalIndexSize), em bytes.
+
+        Raises:
+            PyMongoError: Em caso de falha na consulta das estatísticas.
+        """
+        try:
+            stats = self.db.command("collStats", collection_name)
+            return {
+                "count": stats.get("count", 0),
+                "size": stats.get("size", 0),
+                "storageSize": stats.get("storageSize", 0),
+                "totalIndexSize": stats.get("totalIndexSize", 0),
+            }
+        except PyMongoError as e:
+            logger.error(f"Erro ao obter estatísticas da coleção '{collection_name}': {e}")
+            raise
+
+    def read_checkpoint(self, stage: str) -> Optional[str]:
+        """
+        Lê a chave da etapa gravada na coleção de controle do próprio banco.
 
-    def to_dataframe(self, collection_name: str, query: Dict[str, Any] = {}) -> pd.DataFrame:
+        Args:
+            stage (str): Nome da etapa da pipeline.
+
+        Returns:
+            Optional[str]: Chave da última carga concluída ou None se não houver marcador.
+        """
+        marker = self.db[CHECKPOINT_COLLECTION].find_one({"_id": stage})
+        return marker["chave"] if marker else None
+
+    def write_checkpoint(self, stage: str, key: str) -> None:
+        """
+        Grava a chave da etapa na coleção de controle.
+
+        Args:
+            stage (str): Nome da etapa da pipeline.
+            key (str): Chave das entradas da carga.
+        """
+        self.db[CHECKPOINT_COLLECTION].replace_one(
+            {"_id": stage}, {"chave": key, "concluido_em": datetime.now()}, upsert=True
+        )
+        logger.debug(f"Marcador da etapa '{stage}' gravado no MongoDB (chave {key}).")
+
+    def clear_checkpoint(self, stage: str) -> None:
+        """
+        Remove o marcador da etapa, se existir.
+
+        Args:
+            stage (str): Nome da etapa da pipeline.
+        """
+        self.db[CHECKPOINT_COLLECTION].delete_one({"_id": stage})
+
+    def to_dataframe(
+        self, collection_name: str, query: Dict[str, Any] = {}, schema: Optional[str] = None
+    ) -> pd.DataFrame:
         """
         Converte os documentos de uma coleção MongoDB para um DataFrame do pandas.
 
         Args:
             collection_name (str): Nome da coleção a ser consultada.
             query (Dict[str, Any], opcional): Filtro da consulta. Default é {} (todos os documentos).
+            schema (Optional[str]): Nome do schema em etl.schemas usado para compactar os tipos
+                das colunas. Se None, mantém os tipos inferidos pelo pandas.
 
         Returns:
             pd.DataFrame: DataFrame contendo os documentos da coleção.
@@ -139,6 +229,10 @@ class MongoDBClient:
             if "_id" in df.columns:
                 df.drop(columns=["_id"], inplace=True)
 
+            if schema is not None:
+                from etl.schemas import apply_schema
+                df = apply_schema(df, schema)
+
             logger.success(f"DataFrame criado com {len(df)} registros da coleção '{collection_name}'.")
             return df
 
@@ -146,6 +240,42 @@ class MongoDBClient:
             logger.error(f"Erro ao converter coleção '{collection_name}' para DataFrame: {e}")
             raise
 
+    def aggregate_to_dataframe(
+        self, collection_name: str, pipeline: List[Dict[str, Any]], schema: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Executa um pipeline de agregação e converte o resultado para um DataFrame do pandas.
+
+        Args:
+            collection_name (str): Nome da coleção de origem.
+            pipeline (List[Dict[str, Any]]): Estágios do pipeline de agregação.
+            schema (Optional[str]): Nome do schema em etl.schemas usado para compactar os tipos
+                das colunas. Se None, mantém os tipos inferidos pelo pandas.
+
+        Returns:
+            pd.DataFrame: DataFrame com os documentos retornados pelo pipeline.
+
+        Raises:
+            PyMongoError: Em caso de erro na agregação.
+        """
+        try:
+            logger.info(f"Convertendo agregação da coleção '{collection_name}' para DataFrame...")
+            df = pd.DataFrame(list(self.db[collection_name].aggregate(pipeline)))
+
+            if "_id" in df.columns:
+                df.drop(columns=["_id"], inplace=True)
+
+            if schema is not None:
+                from etl.schemas import apply_schema
+                df = apply_schema(df, schema)
+
+            logger.success(f"DataFrame criado com {len(df)} registros da agregação em '{collection_name}'.")
+            return df
+
+        except PyMongoError as e:
+            logger.error(f"Erro ao converter agregação da coleção '{collection_name}' para DataFrame: {e}")
+            raise
+
 if __name__ == "__main__":
     mongo_client = MongoDBClient()
     try:
@@ -1,12 +1,44 @@
 import os
-from typing import Optional
+import sys
+from datetime import date
+from typing import Dict, Optional, List, Tuple
 import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
-from dotenv import load_dotenv
 from loguru import logger
 
-load_dotenv()
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src")))
+
+from services.env import load_environment
+
+PHYSICAL_PROFILES = ("baseline", "covering_indexes", "partitioned", "compressed")
+# Tabela de controle com a chave da última carga concluída (checkpoints da pipeline)
+CHECKPOINT_TABLE = "_checkpoint"
+
+
+def partition_date_range(tables: Dict[str, pd.DataFrame]) -> Optional[Tuple[date, date]]:
+    """
+    Calcula a menor e a maior data de pedidos.data_pedido e avaliacoes.data, usadas para
+    derivar as partições mensais do perfil 'partitioned' a partir dos próprios dados.
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Tabelas transformadas.
+
+    Returns:
+        Optional[Tuple[date, date]]: (menor data, maior data) ou None se não houver datas.
+    """
+    datas = [
+        tables[table][column].dropna()
+        for table, column in (("pedidos", "data_pedido"), ("avaliacoes", "data"))
+        if table in tables
+    ]
+    datas = [serie for serie in datas if len(serie)]
+    if not datas:
+        return None
+    return (
+        min(pd.Timestamp(serie.min()) for serie in datas).date(),
+        max(pd.Timestamp(serie.max()) for serie in datas).date(),
+    )
 
 
 class MySQLClient:
@@ -21,6 +53,7 @@ class MySQLClient:
         Args:
             uri (Optional[str]): URI de conexão MySQL. Se None, utiliza variável de ambiente.
         """
+        load_environment()
         self._adjust_environment_host()
         self.uri = uri or self._get_mysql_uri()
         self.engine = create_engine(self.uri)
@@ -104,31 +137,192 @@ class MySQLClient:
             logger.error(f"Erro ao ler a tabela '{table_name}': {e}")
             raise
 
-    def create_all_tables(self) -> None:
+    def read_checkpoint(self, stage: str) -> Optional[str]:
         """
-        Cria as tabelas no banco de dados relacional conforme o schema definido.
+        Lê a chave da etapa gravada na tabela de controle do próprio banco.
+
+        Args:
+            stage (str): Nome da etapa da pipeline.
+
+        Returns:
+            Optional[str]: Chave da última carga concluída ou None se não houver marcador.
+
+        Raises:
+            SQLAlchemyError: Em caso de erro na consulta.
         """
-        ddl = """
+        try:
+            with self.engine.connect() as conn:
+                exists = conn.execute(text(
+                    "SELECT COUNT(*) FROM information_schema.tables "
+                    "WHERE table_schema = :schema AND table_name = :table"
+                ), {"schema": self.engine.url.database, "table": CHECKPOINT_TABLE}).scalar_one()
+                if not exists:
+                    return None
+                return conn.execute(
+                    text(f"SELECT chave FROM `{CHECKPOINT_TABLE}` WHERE etapa = :stage"), {"stage": stage}
+                ).scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error(f"Erro ao ler o marcador da etapa '{stage}': {e}")
+            raise
+
+    def write_checkpoint(self, stage: str, key: str) -> None:
+        """
+        Grava a chave da etapa na tabela de controle. Como drop_all_tables também remove essa
+        tabela, qualquer recriação do schema invalida o marcador.
+
+        Args:
+            stage (str): Nome da etapa da pipeline.
+            key (str): Chave das entradas da carga.
+
+        Raises:
+            SQLAlchemyError: Em caso de erro na gravação.
+        """
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text(f"""
+                    CREATE TABLE IF NOT EXISTS `{CHECKPOINT_TABLE}` (
+                        etapa VARCHAR(64) PRIMARY KEY,
+                        chave VARCHAR(64) NOT NULL,
+                        concluido_em DATETIME(6) NOT NULL
+                    )
+                """.strip()))
+                conn.execute(
+                    text(f"REPLACE INTO `{CHECKPOINT_TABLE}` (etapa, chave, concluido_em) VALUES (:stage, :key, NOW(6))"),
+                    {"stage": stage, "key": key},
+                )
+            logger.debug(f"Marcador da etapa '{stage}' gravado no MySQL (chave {key}).")
+        except SQLAlchemyError as e:
+            logger.error(f"Erro ao gravar o marcador da etapa '{stage}': {e}")
+            raise
+
+    def clear_checkpoint(self, stage: str) -> None:
+        """
+        Remove o marcador da etapa, se existir.
+
+        Args:
+            stage (str): Nome da etapa da pipeline.
+
+        Raises:
+            SQLAlchemyError: Em caso de erro na remoção.
+        """
+        if self.read_checkpoint(stage) is None:
+            return
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text(f"DELETE FROM `{CHECKPOINT_TABLE}` WHERE etapa = :stage"), {"stage": stage})
+        except SQLAlchemyError as e:
+            logger.error(f"Erro ao remover o marcador da etapa '{stage}': {e}")
+            raise
+
+    def _monthly_partitions(self, date_range: Optional[Tuple[date, date]] = None, months: int = 24) -> str:
+        """
+        Monta as partições mensais (RANGE COLUMNS) de pedidos e avaliacoes. Com `date_range`
+        as partições cobrem do mês da menor ao mês da maior data dos dados; sem ele, cobrem
+        os últimos `months` meses até hoje.
+        """
+        if date_range is not None:
+            start, end = date_range
+        else:
+            end = date.today()
+            inicio = end.year * 12 + end.month - 1 - months  # meses desde o ano 0
+            start = date(inicio // 12, inicio % 12 + 1, 1)
+        year, month = start.year, start.month
+
+        partitions = []
+        while (year, month) <= (end.year, end.month):
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            partitions.append(
+                f"PARTITION p{year}{month:02d} VALUES LESS THAN ('{next_year}-{next_month:02d}-01')"
+            )
+            year, month = next_year, next_month
+        partitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+        return ",\n          ".join(partitions)
+
+    def _schema_ddl(self, profile: str, date_range: Optional[Tuple[date, date]] = None) -> List[str]:
+        """
+        Retorna os comandos DDL das tabelas para o perfil de desenho físico informado.
+
+        Args:
+            profile (str): Um dos perfis em PHYSICAL_PROFILES.
+            date_range (Optional[Tuple[date, date]]): Menor e maior data dos dados, usadas
+                nas partições do perfil 'partitioned' (ver partition_date_range).
+
+        Returns:
+            List[str]: Comandos DDL na ordem de execução.
+
+        Raises:
+            ValueError: Se o perfil não for suportado.
+        """
+        if profile not in PHYSICAL_PROFILES:
+            raise ValueError(f"Perfil físico desconhecido: '{profile}'. Opções: {PHYSICAL_PROFILES}")
+
+        options = " ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8" if profile == "compressed" else ""
+
+        ddl = [
+            f"""
         CREATE TABLE IF NOT EXISTS clientes (
           id INT AUTO_INCREMENT PRIMARY KEY,
           nome VARCHAR(100),
           email VARCHAR(100),
           data_cadastro DATE
-        );
-
+        ){options}""",
+            f"""
         CREATE TABLE IF NOT EXISTS produtos (
           id INT AUTO_INCREMENT PRIMARY KEY,
           nome VARCHAR(100),
           preco DECIMAL(10,2)
-        );
-
+        ){options}""",
+        ]
+
+        if profile == "partitioned":
+            # Tabelas particionadas no InnoDB não suportam chaves estrangeiras e exigem
+            # que a coluna de particionamento faça parte da chave primária.
+            ddl += [
+                f"""
+        CREATE TABLE IF NOT EXISTS pedidos (
+          id INT AUTO_INCREMENT,
+          cliente_id INT,
+          data_pedido DATETIME NOT NULL,
+          PRIMARY KEY (id, data_pedido),
+          KEY idx_pedidos_cliente (cliente_id)
+        )
+        PARTITION BY RANGE COLUMNS (data_pedido) (
+          {self._monthly_partitions(date_range)}
+        )""",
+                """
+        CREATE TABLE IF NOT EXISTS itens_pedido (
+          pedido_id INT,
+          produto_id INT,
+          quantidade INT,
+          preco_unitario DECIMAL(10,2),
+          PRIMARY KEY (pedido_id, produto_id),
+          FOREIGN KEY (produto_id) REFERENCES produtos(id)
+        )""",
+                f"""
+        CREATE TABLE IF NOT EXISTS avaliacoes (
+          id INT AUTO_INCREMENT,
+          produto_id INT,
+          cliente_id INT,
+          avaliacao DECIMAL(2,1),
+          comentario VARCHAR(255),
+          data DATETIME(6) NOT NULL,
+          PRIMARY KEY (id, data),
+          KEY idx_avaliacoes_produto (produto_id)
+        )
+        PARTITION BY RANGE COLUMNS (data) (
+          {self._monthly_partitions(date_range)}
+        )""",
+            ]
+        else:
+            ddl += [
+                f"""
         CREATE TABLE IF NOT EXISTS pedidos (
           id INT AUTO_INCREMENT PRIMARY KEY,
           cliente_id INT,
           data_pedido DATETIME,
           FOREIGN KEY (cliente_id) REFERENCES clientes(id)
-        );
-
+        ){options}""",
+                f"""
         CREATE TABLE IF NOT EXISTS itens_pedido (
           pedido_id INT,
           produto_id INT,
@@ -137,20 +331,81 @@ class MySQLClient:
           PRIMARY KEY (pedido_id, produto_id),
           FOREIGN KEY (pedido_id) REFERENCES pedidos(id),
           FOREIGN KEY (produto_id) REFERENCES produtos(id)
-        );
+        ){options}""",
+                f"""
+        CREATE TABLE IF NOT EXISTS avaliacoes (
+          id INT AUTO_INCREMENT PRIMARY KEY,
+          produto_id INT,
+          cliente_id INT,
+          avaliacao DECIMAL(2,1),
+          comentario VARCHAR(255),
+          data DATETIME(6),
+          FOREIGN KEY (produto_id) REFERENCES produtos(id),
+          FOREIGN KEY (cliente_id) REFERENCES clientes(id)
+        ){options}""",
+            ]
+
+        if profile == "covering_indexes":
+            ddl += [
+                "CREATE INDEX idx_pedidos_cliente ON pedidos (cliente_id, id)",
+                "CREATE INDEX idx_pedidos_data ON pedidos (data_pedido, cliente_id)",
+                "CREATE INDEX idx_itens_produto_quantidade ON itens_pedido (produto_id, quantidade)",
+                "CREATE INDEX idx_itens_pedido_valor ON itens_pedido (pedido_id, quantidade, preco_unitario)",
+                # Índices por data para as consultas de janela de tempo (range scan + cobertura)
+                "CREATE INDEX idx_avaliacoes_data ON avaliacoes (data, produto_id, avaliacao)",
+            ]
+
+        return ddl
+
+    def create_all_tables(self, profile: str = "baseline", date_range: Optional[Tuple[date, date]] = None) -> None:
         """
+        Cria as tabelas no banco de dados relacional conforme o schema definido.
 
+        Args:
+            profile (str): Perfil de desenho físico (ver PHYSICAL_PROFILES):
+                'baseline' (apenas PKs e FKs), 'covering_indexes' (índices secundários
+                e de cobertura), 'partitioned' (pedidos e avaliacoes particionados por data) ou
+                'compressed' (ROW_FORMAT=COMPRESSED no InnoDB).
+            date_range (Optional[Tuple[date, date]]): Menor e maior data dos dados usadas nas
+                partições mensais. Se None, as partições cobrem os últimos 24 meses.
+        """
         try:
             with self.engine.begin() as conn:
-                for stmt in ddl.strip().split(";"):
-                    stmt = stmt.strip()
-                    if stmt:
-                        conn.execute(text(stmt))
-            logger.success("Tabelas criadas com sucesso (ou já existiam).")
+                for stmt in self._schema_ddl(profile, date_range):
+                    conn.execute(text(stmt.strip()))
+            logger.success(f"Tabelas criadas com sucesso (ou já existiam). Perfil físico: '{profile}'.")
         except SQLAlchemyError as e:
             logger.error(f"Erro ao criar tabelas: {e}")
             raise
 
+    def table_sizes(self) -> pd.DataFrame:
+        """
+        Retorna o tamanho dos dados e dos índices de cada tabela do banco atual.
+
+        Returns:
+            pd.DataFrame: Colunas tabela, linhas, dados_bytes, indices_bytes.
+
+        Raises:
+            SQLAlchemyError: Em caso de erro na consulta.
+        """
+        try:
+            with self.engine.connect() as conn:
+                # Evita estatísticas em cache no information_schema (padrão de 24h no MySQL 8)
+                conn.execute(text("SET SESSION information_schema_stats_expiry = 0"))
+                tables = conn.execute(text(
+                    "SELECT table_name FROM information_schema.tables WHERE table_schema = :schema"
+                ), {"schema": self.engine.url.database}).scalars().all()
+                for table in tables:
+                    conn.execute(text(f"ANALYZE TABLE `{table}`"))
+                return pd.read_sql(text(
+                    "SELECT table_name AS tabela, table_rows AS linhas, "
+                    "data_length AS dados_bytes, index_length AS indices_bytes "
+                    "FROM information_schema.tables WHERE table_schema = :schema"
+                ), conn, params={"schema": self.engine.url.database})
+        except SQLAlchemyError as e:
+            logger.error(f"Erro ao consultar o tamanho das tabelas: {e}")
+            raise
+
     def drop_all_tables(self) -> None:
         """
         Remove todas as tabelas do banco de dados atual, desabilitando temporariamente
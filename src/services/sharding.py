@@ -0,0 +1,294 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sqlalchemy import text
+from services.mongo_handler import MongoDBClient
+from services.mysql_handler import MySQLClient
+from services.duckdb_handler import DuckDBClient
+from etl.mongo_models import dataset_documents
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Constante multiplicativa de Fibonacci (2^64 / φ) para espalhar chaves inteiras entre shards
+_FIBONACCI_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+
+def get_shard_uris(env_var: str) -> List[str]:
+    """
+    Lê uma lista de URIs de shards separadas por vírgula de uma variável de ambiente.
+
+    Args:
+        env_var (str): Nome da variável (ex.: MONGO_SHARD_URIS, MYSQL_SHARD_URIS).
+
+    Returns:
+        List[str]: URIs configuradas (vazia se a variável não existir).
+    """
+    return [uri.strip() for uri in os.getenv(env_var, "").split(",") if uri.strip()]
+
+
+def shard_indices(keys: Any, num_shards: int) -> np.ndarray:
+    """
+    Calcula o shard de cada chave com um hash multiplicativo estável
+    (independente de PYTHONHASHSEED e vetorizado).
+
+    Args:
+        keys (Any): Chaves inteiras (lista, Series ou array).
+        num_shards (int): Quantidade de shards.
+
+    Returns:
+        np.ndarray: Índice do shard de cada chave.
+    """
+    hashed = np.asarray(keys, dtype=np.uint64) * _FIBONACCI_HASH
+    return ((hashed >> np.uint64(32)) % np.uint64(num_shards)).astype(np.int64)
+
+
+def merge_partials(partials: List[pd.DataFrame], rule: Dict[str, Any], limit: int = 10) -> pd.DataFrame:
+    """
+    Combina os agregados parciais de cada shard: soma as colunas aditivas por chave,
+    calcula razões a partir das somas (nunca média de médias), ordena e aplica o top N.
+
+    Args:
+        partials (List[pd.DataFrame]): Resultados parciais de cada shard.
+        rule (Dict[str, Any]): Regra de combinação com 'keys', 'sums', 'order_by' e,
+            opcionalmente, 'ratio' = (coluna_resultado, numerador, denominador).
+        limit (int): Quantidade de linhas do resultado final.
+
+    Returns:
+        pd.DataFrame: Resultado combinado (vazio, com as colunas do resultado, se nenhum shard retornou linhas).
+    """
+    if not partials:
+        columns = rule["keys"] + ([rule["ratio"][0]] if "ratio" in rule else rule["sums"])
+        return pd.DataFrame(columns=columns)
+    combined = pd.concat(partials, ignore_index=True)
+    for column in rule["sums"]:
+        # DECIMAL do MySQL chega como objetos Decimal; converte para somar e dividir
+        combined[column] = pd.to_numeric(combined[column])
+    # observed=True: chaves categóricas (ex.: produtos.nome) não geram combinações inexistentes
+    merged = combined.groupby(rule["keys"], as_index=False, sort=False, observed=True)[rule["sums"]].sum()
+
+    if "ratio" in rule:
+        column, numerator, denominator = rule["ratio"]
+        merged[column] = merged[numerator] / merged[denominator].replace(0, np.nan)
+        merged = merged.drop(columns=rule["sums"])
+
+    return merged.sort_values(rule["order_by"], ascending=False, na_position="last").head(limit).reset_index(drop=True)
+
+
+def route_tables(tables: Dict[str, pd.DataFrame], num_shards: int) -> List[Dict[str, pd.DataFrame]]:
+    """
+    Divide as tabelas do modelo relacional entre os shards: clientes, pedidos, itens_pedido e
+    avaliacoes são roteados pelo cliente_id (mantendo as FKs no mesmo shard) e as demais
+    tabelas (produtos) são replicadas.
+
+    Args:
+        tables (Dict[str, pd.DataFrame]): Tabelas clientes, produtos, pedidos, itens_pedido e avaliacoes.
+        num_shards (int): Quantidade de shards.
+
+    Returns:
+        List[Dict[str, pd.DataFrame]]: Tabelas de cada shard.
+    """
+    pedidos = tables["pedidos"]
+    pedido_shard = pd.Series(shard_indices(pedidos["cliente_id"], num_shards), index=pedidos["id"].to_numpy())
+    targets = {
+        "clientes": shard_indices(tables["clientes"]["id"], num_shards),
+        "pedidos": pedido_shard.to_numpy(),
+        "itens_pedido": pedido_shard.loc[tables["itens_pedido"]["pedido_id"].to_numpy()].to_numpy(),
+    }
+    if "avaliacoes" in tables:
+        targets["avaliacoes"] = shard_indices(tables["avaliacoes"]["cliente_id"], num_shards)
+
+    return [
+        {
+            table_name: df if table_name not in targets else df[targets[table_name] == i]
+            for table_name, df in tables.items()
+        }
+        for i in range(num_shards)
+    ]
+
+
+class ShardedMongoDBClient:
+    """
+    Distribui documentos entre várias instâncias MongoDB pelo hash de cliente_id
+    e executa agregações em paralelo em todos os shards (scatter-gather).
+    """
+
+    def __init__(self, shard_uris: List[str]) -> None:
+        """
+        Args:
+            shard_uris (List[str]): URIs das instâncias MongoDB, uma por shard.
+        """
+        self.shards = [MongoDBClient(uri) for uri in shard_uris]
+
+    def _parallel(self, fn: Callable[[int, MongoDBClient], Any]) -> List[Any]:
+        with ThreadPoolExecutor(max_workers=len(self.shards)) as executor:
+            return list(executor.map(fn, range(len(self.shards)), self.shards))
+
+    def connect(self, db_name: str) -> None:
+        for shard in self.shards:
+            shard.connect(db_name)
+
+    def clear_collections(self, collections: List[str]) -> None:
+        for shard in self.shards:
+            shard.clear_collections(collections)
+
+    def insert_sharded(self, collection_name: str, documents: List[Dict[str, Any]], key: str) -> None:
+        """
+        Insere cada documento no shard definido pelo hash do campo `key`.
+        """
+        targets = shard_indices([doc[key] for doc in documents], len(self.shards))
+
+        def insert(i: int, shard: MongoDBClient) -> None:
+            docs = [doc for doc, target in zip(documents, targets) if target == i]
+            if docs:
+                shard.insert_many(collection_name, docs)
+
+        self._parallel(insert)
+
+    def insert_replicated(self, collection_name: str, documents: List[Dict[str, Any]]) -> None:
+        """
+        Replica os documentos em todos os shards (tabelas de referência pequenas, ex.: products).
+        """
+        self._parallel(lambda i, shard: shard.insert_many(collection_name, [dict(doc) for doc in documents]))
+
+    def aggregate(self, collection_name: str, pipeline: List[Dict]) -> List[pd.DataFrame]:
+        """
+        Executa o pipeline em paralelo em todos os shards.
+
+        Returns:
+            List[pd.DataFrame]: Resultado parcial de cada shard.
+        """
+        return self._parallel(
+            lambda i, shard: pd.DataFrame(list(shard.db[collection_name].aggregate(pipeline)))
+        )
+
+    def close(self) -> None:
+        for shard in self.shards:
+            if shard.client is not None:
+                shard.client.close()
+
+
+class ShardedMySQLClient:
+    """
+    Distribui linhas entre várias instâncias MySQL pelo hash de cliente_id
+    (pedidos e itens ficam no shard do cliente) e executa consultas em paralelo (scatter-gather).
+    """
+
+    def __init__(self, shard_uris: List[str]) -> None:
+        """
+        Args:
+            shard_uris (List[str]): URIs SQLAlchemy das instâncias MySQL, uma por shard.
+        """
+        self.shards = [MySQLClient(uri) for uri in shard_uris]
+
+    def _parallel(self, fn: Callable[[int, MySQLClient], Any]) -> List[Any]:
+        with ThreadPoolExecutor(max_workers=len(self.shards)) as executor:
+            return list(executor.map(fn, range(len(self.shards)), self.shards))
+
+    def recreate_tables(self, profile: str = "baseline", date_range: Optional[Tuple[date, date]] = None) -> None:
+        for shard in self.shards:
+            shard.drop_all_tables()
+            shard.create_all_tables(profile, date_range)
+
+    def load_tables(self, tables: Dict[str, pd.DataFrame]) -> None:
+        """
+        Carrega as tabelas do modelo relacional nos shards, roteadas por route_tables.
+
+        Args:
+            tables (Dict[str, pd.DataFrame]): Tabelas clientes, produtos, pedidos, itens_pedido e avaliacoes.
+        """
+        parts = route_tables(tables, len(self.shards))
+
+        def load(i: int, shard: MySQLClient) -> None:
+            for table_name, part in parts[i].items():
+                shard.df_to_table(part, table_name)
+
+        self._parallel(load)
+
+    def read_sql(self, query: str) -> List[pd.DataFrame]:
+        """
+        Executa a consulta em paralelo em todos os shards.
+
+        Returns:
+            List[pd.DataFrame]: Resultado parcial de cada shard.
+        """
+        def read(i: int, shard: MySQLClient) -> pd.DataFrame:
+            with shard.engine.connect() as conn:
+                return pd.read_sql(text(query), conn)
+
+        return self._parallel(read)
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.engine.dispose()
+
+
+class ShardedDuckDBClient:
+    """
+    Substituto em processo dos shards MySQL: cada shard é um DuckDB embarcado com a sua parte
+    das tabelas (mesmo roteamento de route_tables), consultado em paralelo com as consultas
+    parciais em SQL. Permite medir e validar o scatter-gather sem instâncias configuradas.
+    """
+
+    def __init__(self, num_shards: int) -> None:
+        """
+        Args:
+            num_shards (int): Quantidade de shards (um banco DuckDB em memória por shard).
+        """
+        self.shards = [DuckDBClient() for _ in range(num_shards)]
+
+    def _parallel(self, fn: Callable[[int, DuckDBClient], Any]) -> List[Any]:
+        with ThreadPoolExecutor(max_workers=len(self.shards)) as executor:
+            return list(executor.map(fn, range(len(self.shards)), self.shards))
+
+    def load_tables(self, tables: Dict[str, pd.DataFrame]) -> None:
+        """
+        Registra em cada shard a sua parte das tabelas, roteadas por route_tables.
+        """
+        for shard, part in zip(self.shards, route_tables(tables, len(self.shards))):
+            shard.register_tables(part)
+
+    def read_sql(self, query: str) -> List[pd.DataFrame]:
+        """
+        Executa a consulta em paralelo em todos os shards.
+
+        Returns:
+            List[pd.DataFrame]: Resultado parcial de cada shard.
+        """
+        return self._parallel(lambda i, shard: shard.query(query))
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.close()
+
+
+def scatter_gather(
+    fetch: Callable[[], List[pd.DataFrame]], rule: Dict[str, Any], limit: int = 10
+) -> pd.DataFrame:
+    """
+    Executa a coleta paralela dos parciais e combina o resultado no cliente.
+    """
+    partials = [df for df in fetch() if not df.empty]
+    logger.debug(f"Scatter-gather: {len(partials)} parciais combinados.")
+    return merge_partials(partials, rule, limit)
+
+
+def load_sharded_mongo(
+    client: ShardedMongoDBClient, dataset: Dict[str, "pa.Table"], db_name: str = "ecommerce_sharded"
+) -> None:
+    """
+    Carrega o dataset nos shards MongoDB: clients por id, carts e reviews por cliente_id
+    e products replicado (necessário para o $lookup local em cada shard).
+    """
+    client.connect(db_name)
+    client.clear_collections(["clients", "products", "reviews", "carts"])
+    documents = dataset_documents("referenced", dataset)
+    client.insert_sharded("clients", documents["clients"], key="id")
+    client.insert_replicated("products", documents["products"])
+    client.insert_sharded("reviews", documents["reviews"], key="cliente_id")
+    client.insert_sharded("carts", documents["carts"], key="cliente_id")
+